@@ -236,26 +236,12 @@ def block_splitter(items, max_weight, weight=lambda item: 1, key=nokey,
     >>> list(block_splitter(items, 2, key=operator.itemgetter(1)))
     [<WeightedSequence ['A1'], weight=1>, <WeightedSequence ['C2', 'D2'], weight=2>, <WeightedSequence ['E2'], weight=1>]
     """
-    if max_weight <= 0:
-        raise ValueError('max_weight=%s' % max_weight)
-    ws = WeightedSequence([])
-    prev_key = 'Unspecified'
-    for item in sorted(items, key=weight, reverse=True) if sort else items:
-        w = weight(item)
-        k = key(item)
-        if w < 0:  # error
-            raise ValueError('The item %r got a negative weight %s!' %
-                             (item, w))
-        elif ws.weight + w > max_weight or k != prev_key:
-            new_ws = WeightedSequence([(item, w)])
-            if ws:
-                yield ws
-            ws = new_ws
-        elif w > 0:  # ignore items with 0 weight
-            ws.append((item, w))
-        prev_key = k
-    if ws:
-        yield ws
+    # the weight of each item is computed only once, even when sorting
+    pairs = ((weight(item), item) for item in items)
+    if sort:
+        pairs = sorted(pairs, key=operator.itemgetter(0), reverse=True)
+    yield from _split(((item, w, key(item)) for w, item in pairs),
+                      max_weight)
 
 
 def split_in_slices(number, num_slices):
@@ -330,11 +316,42 @@ def split_in_blocks(sequence, hint, weight=lambda item: 1, key=nokey):
         for k, group in groupby(sequence, key).items():
             blocks.append(group)
         return blocks
-    items = sorted(sequence, key=lambda item: (key(item), weight(item)))
+    items = list(sequence)
     assert hint > 0, hint
     assert len(items) > 0, len(items)
-    total_weight = float(sum(weight(item) for item in items))
-    return block_splitter(items, math.ceil(total_weight / hint), weight, key)
+    # compute the weights and the keys only once, since they can be slow
+    weights = [weight(item) for item in items]
+    if key is nokey:
+        keys = ['Unspecified'] * len(items)
+        order = numpy.argsort(weights, kind='stable')
+    else:
+        keys = [key(item) for item in items]
+        order = sorted(range(len(items)), key=lambda i: (keys[i], weights[i]))
+    total_weight = float(sum(weights))
+    return _split(((items[i], weights[i], keys[i]) for i in order),
+                  math.ceil(total_weight / hint))
+
+
+def _split(triples, max_weight):
+    # yield WeightedSequences from triples (item, weight, key)
+    if max_weight <= 0:
+        raise ValueError('max_weight=%s' % max_weight)
+    ws = WeightedSequence([])
+    prev_key = 'Unspecified'
+    for item, w, k in triples:
+        if w < 0:  # error
+            raise ValueError('The item %r got a negative weight %s!' %
+                             (item, w))
+        elif ws.weight + w > max_weight or k != prev_key:
+            new_ws = WeightedSequence([(item, w)])
+            if ws:
+                yield ws
+            ws = new_ws
+        elif w > 0:  # ignore items with 0 weight
+            ws.append((item, w))
+        prev_key = k
+    if ws:
+        yield ws
 
 
 def assert_close(a, b, rtol=1e-07, atol=0, context=None):
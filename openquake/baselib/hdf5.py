@@ -44,6 +44,9 @@ vfloat64 = h5py.special_dtype(vlen=numpy.float64)
 FLOAT = (float, numpy.float32, numpy.float64)
 INT = (int, numpy.int32, numpy.uint32, numpy.int64, numpy.uint64)
 MAX_ROWS = 10_000_000
+CHUNK_BYTES = 1024 ** 2  # target size of the chunks of extendable datasets
+# chunk cache to use when reading many slices of an extendable dataset
+RDCC_NBYTES = 16 * 1024 ** 2
 
 if sys.platform == 'win32':
     # go back to the behavior before hdf5==1.12 i.e. h5py==3.4
@@ -64,6 +67,29 @@ def sanitize(value):
     return value
 
 
+def auto_chunks(shape, itemsize, nbytes=CHUNK_BYTES):
+    """
+    :param shape: the shape of an extendable dataset, starting with None
+    :param itemsize: the size of an element in bytes
+    :param nbytes: the target size of a chunk in bytes
+    :returns: a chunk shape of about nbytes, with as many rows as possible
+
+    >>> auto_chunks((None,), 8)
+    (131072,)
+    >>> auto_chunks((None, 3, 1000), 4)
+    (87, 3, 1000)
+    >>> auto_chunks((None, 1000, 1000), 4)
+    (1, 500, 500)
+    """
+    chunks = [1] + [max(dim, 1) for dim in shape[1:]]
+    # halve the largest inner dimension until a row fits in a chunk
+    while numpy.prod(chunks) * itemsize > nbytes and max(chunks) > 1:
+        i = numpy.argmax(chunks)
+        chunks[i] = (chunks[i] + 1) // 2
+    chunks[0] = max(1, nbytes // int(numpy.prod(chunks) * itemsize))
+    return tuple(chunks)
+
+
 def create(hdf5, name, dtype, shape=(None,), compression=None,
            fillvalue=0, attrs=None):
     """
@@ -76,8 +102,11 @@ def create(hdf5, name, dtype, shape=(None,), compression=None,
     :returns: a HDF5 dataset
     """
     if shape[0] is None:  # extendable dataset
+        # chunks of about 1 MB, so that reading a slice of rows
+        # touches few chunks which fit in the chunk cache
+        chunks = auto_chunks(shape, numpy.dtype(dtype).itemsize)
         dset = hdf5.create_dataset(
-            name, (0,) + shape[1:], dtype, chunks=True, maxshape=shape,
+            name, (0,) + shape[1:], dtype, chunks=chunks, maxshape=shape,
             compression=compression)
     else:  # fixed-shape dataset
         dset = hdf5.create_dataset(name, shape, dtype, fillvalue=fillvalue,
@@ -148,6 +177,24 @@ def get_nbytes(dset):
         return dset.size * numpy.zeros(1, dset.dtype).nbytes
 
 
+def read_all(dset):
+    """
+    Read a whole dataset with a single low-level H5Dread call, skipping
+    the high-level indexing machinery of h5py. Scalar, empty and
+    variable-length datasets are read in the usual way.
+
+    :param dset: an HDF5 dataset
+    :returns: the underlying array
+    """
+    dt = dset.dtype
+    if (not dset.shape or dset.size == 0 or dt.hasobject or
+            h5py.check_vlen_dtype(dt) or h5py.check_string_dtype(dt)):
+        return dset[()]
+    out = numpy.empty(dset.shape, dt)
+    dset.id.read(h5py.h5s.ALL, h5py.h5s.ALL, out)
+    return out
+
+
 class ByteCounter(object):
     """
     A visitor used to measure the dimensions of a HDF5 dataset or group.
@@ -501,7 +548,7 @@ class File(h5py.File):
                 h5obj = {unquote_plus(k): self['%s/%s' % (path, k)]
                          for k, v in h5obj.items()}
             elif hasattr(h5obj, 'shape'):
-                h5obj = h5obj[()]
+                h5obj = read_all(h5obj)
             if hasattr(obj, '__fromh5__'):
                 obj.__fromh5__(h5obj, h5attrs)
             else:  # Group object
@@ -622,7 +669,7 @@ class ArrayWrapper(object):
         elif hasattr(obj, '__toh5__'):
             return obj
         elif hasattr(obj, 'attrs'):  # is a dataset
-            array, attrs = obj[()], dict(obj.attrs)
+            array, attrs = read_all(obj), dict(obj.attrs)
             if 'json' in attrs:
                 attrs.update(get_shape_descr(attrs.pop('json')))
         else:  # assume obj is an array
@@ -664,7 +711,7 @@ class ArrayWrapper(object):
     def __fromh5__(self, dic, attrs):
         for k, v in dic.items():
             if isinstance(v, h5py.Dataset):
-                arr = v[()]
+                arr = read_all(v)
                 if isinstance(arr, INT):
                     arr = numpy.arange(arr)
                 elif len(arr) and isinstance(arr[0], bytes):
@@ -86,15 +86,16 @@ kind of applications we are interested in (CPU-dominated, which large
 tasks such that the time to spawn a new process is negligible with
 respect to the time to perform the task), so it is not recommended.
 
-If you are using a pool, is always a good idea to cleanup resources at the end
-with
+The pool is started the first time it is needed and then reused by all
+the following Starmaps, until it is terminated with
 
 >>> Starmap.shutdown()
 
-`Starmap.shutdown` is always defined. It does nothing if there is
-no pool, but it is still better to call it: in the future, you may change
-idea and use another parallelization strategy requiring cleanup. In this
-way your code is future-proof.
+It is always a good idea to cleanup resources at the end: `Starmap.shutdown`
+is always defined and does nothing if there is no pool. If you want to
+reuse the pool across computations calling `Starmap.shutdown`, set
+`Starmap.keep_alive = True`: then the pool is terminated only at exit
+or with `Starmap.shutdown(force=True)`.
 
 Monitoring
 =============================
@@ -178,17 +179,21 @@ a great deal of work trying to split slow sources in more manageable
 fast sources.
 
 """
+import io
 import os
 import re
 import ast
 import sys
+import atexit
 import stat
 import time
 import socket
 import signal
 import pickle
+import threading
 import inspect
 import logging
+import functools
 import operator
 import traceback
 import subprocess
@@ -201,17 +206,20 @@ import numpy
 
 from openquake.baselib import config, hdf5
 from openquake.baselib.python3compat import decode
-from openquake.baselib.zeromq import zmq, Socket
+from openquake.baselib.zeromq import zmq, Socket, iter_sockets
 from openquake.baselib.performance import (
     Monitor, memory_rss, init_performance)
 from openquake.baselib.general import (
     split_in_blocks, block_splitter, AccumDict, humansize, CallableDict,
-    gettemp, engine_version, shortlist, mp as mp_context)
+    WeightedSequence,
+    gettemp, engine_version, shortlist, nokey, mp as mp_context)
 
 sys.setrecursionlimit(2000)  # raised to make pickle happier
 # see https://github.com/gem/oq-engine/issues/5230
 submit = CallableDict()
 GB = 1024 ** 3
+SUBMIT_BATCH = 64  # maximum number of tasks submitted together
+MIN_OOB = 65536  # pickled bytestrings bigger than that are sent out-of-band
 host_cores = config.zworkers.host_cores.split(',')
 
 # see https://scicomp.aalto.fi/triton/tut/array
@@ -256,7 +264,10 @@ def no_submit(self, func, args, monitor):
 
 @submit.add('processpool')
 def processpool_submit(self, func, args, monitor):
-    self.pool.apply_async(safely_call, (func, args, self.task_no, monitor))
+    # the tasks are accumulated and sent in chunks by Starmap.flush
+    self.pending.append((func, args, self.task_no, monitor))
+    if len(self.pending) >= self.CT:
+        self.flush()
 
 
 @submit.add('threadpool')
@@ -264,17 +275,25 @@ def threadpool_submit(self, func, args, monitor):
     self.pool.apply_async(safely_call, (func, args, self.task_no, monitor))
 
 
-@submit.add('zmq')
-def zmq_submit(self, func, args, monitor):
-    idx = self.task_no % len(host_cores)
-    host = host_cores[idx].split()[0]
+def zmq_send(host, tasks):
+    """
+    Send a batch of tasks to the workerpool on the given host
+    """
     port = int(config.zworkers.ctrl_port)
     dest = 'tcp://%s:%d' % (host, port)
     with Socket(dest, zmq.REQ, 'connect', timeout=300) as sock:
-        sub = sock.send((func, args, self.task_no, monitor))
+        sub = sock.send(tasks)
         assert sub == 'submitted', sub
 
 
+@submit.add('zmq')
+def zmq_submit(self, func, args, monitor):
+    # the tasks are accumulated and sent in batches by Starmap.flush
+    self.pending.append((func, args, self.task_no, monitor))
+    if len(self.pending) >= SUBMIT_BATCH:
+        self.flush()
+
+
 @submit.add('ipp')
 def ipp_submit(self, func, args, monitor):
     self.executor.submit(safely_call, func, args, self.task_no, monitor)
@@ -311,34 +330,92 @@ def init_workers():
         setproctitle('oq-worker')
 
 
+_tls = threading.local()  # used to reuse the Pickler in each thread
+
+
+def _dumps(obj, buffers):
+    # pickle.dumps with protocol 5, reusing a Pickler per thread
+    if getattr(_tls, 'busy', False):  # reentrant call, use a new Pickler
+        return pickle.dumps(obj, 5, buffer_callback=buffers.append)
+    if not hasattr(_tls, 'pickler'):
+        _tls.bio = io.BytesIO()
+        _tls.pickler = pickle.Pickler(
+            _tls.bio, 5, buffer_callback=lambda buf: _tls.buffers.append(buf))
+    _tls.busy = True
+    _tls.buffers = buffers
+    try:
+        _tls.bio.seek(0)
+        _tls.bio.truncate()
+        _tls.pickler.clear_memo()
+        _tls.pickler.dump(obj)
+        return _tls.bio.getvalue()
+    finally:
+        _tls.busy = False
+        _tls.buffers = None
+
+
 class Pickled(object):
     """
     An utility to manually pickling/unpickling objects. Pickled instances
     have a nice string representation and length giving the size
-    of the pickled bytestring.
+    of the pickled bytestring. The data of numpy arrays is not copied
+    into the bytestring, it is kept out-of-band (pickle protocol 5).
 
     :param obj: the object to pickle
     """
     def __init__(self, obj):
         self.clsname = obj.__class__.__name__
-        self.calc_id = str(getattr(obj, 'calc_id', ''))  # for monitors
+        self.calc_id = getattr(obj, 'calc_id', None)  # for monitors
+        self.buffers = []
         try:
-            self.pik = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+            self.pik = _dumps(obj, self.buffers)
         except TypeError as exc:  # can't pickle, show the obj in the message
             raise TypeError('%s: %s' % (exc, obj))
+        self._len = len(self.pik) + sum(
+            memoryview(buf).nbytes for buf in self.buffers)
+
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            # PickleBuffers can be pickled only with protocol >= 5; with
+            # lower protocols (i.e. in multiprocessing) they are copied,
+            # once, since the Pickled object can be sent many times
+            if not all(isinstance(buf, bytearray) for buf in self.buffers):
+                self.buffers = [bytearray(buf) for buf in self.buffers]
+            if not isinstance(self.pik, bytes):  # received out-of-band
+                self.pik = bytes(self.pik)
+            return super().__reduce_ex__(protocol)
+        reduced = super().__reduce_ex__(protocol)
+        state = reduced[2]
+        if self.buffers:
+            state = dict(state, buffers=list(
+                map(pickle.PickleBuffer, self.buffers)))
+        if len(self.pik) >= MIN_OOB:
+            # send also the pickled bytestring as a separated zmq frame
+            state = dict(state, pik=pickle.PickleBuffer(self.pik))
+        return reduced[:2] + (state,) + reduced[3:]
 
     def __repr__(self):
         """String representation of the pickled object"""
         return '<Pickled %s #%s %s>' % (
-            self.clsname, self.calc_id, humansize(len(self)))
+            self.clsname, self.calc_id or '', humansize(len(self)))
 
     def __len__(self):
-        """Length of the pickled bytestring"""
-        return len(self.pik)
+        """Length of the pickled bytestring plus the out-of-band buffers"""
+        return self._len
 
     def unpickle(self):
         """Unpickle the underlying object"""
-        return pickle.loads(self.pik)
+        return pickle.loads(self.pik, buffers=self.buffers)
+
+
+def pickled_size(obj):
+    """
+    :returns: the size of a numpy array or of the pickled object
+    """
+    if isinstance(obj, numpy.ndarray) and obj.dtype != object:
+        # no need to pickle it
+        return obj.nbytes
+    return len(Pickled(obj))
 
 
 def get_pickled_sizes(obj):
@@ -358,30 +435,40 @@ def get_pickled_sizes(obj):
     sizes = []
     attrs = getattr(obj, '__dict__',  {})
     for name, value in attrs.items():
-        sizes.append((name, len(Pickled(value))))
+        sizes.append((name, pickled_size(value)))
     return len(Pickled(obj)), sorted(
         sizes, key=lambda pair: pair[1], reverse=True)
 
 
-def pickle_sequence(objects):
+def pickle_sequence(objects, cache=None):
     """
     Convert an iterable of objects into a list of pickled objects.
     If the iterable contains copies, the pickling will be done only once.
     If the iterable contains objects already pickled, they will not be
-    pickled again.
+    pickled again. If a cache is passed, the objects already seen in the
+    previous call are not pickled again: in that case they must not be
+    mutated between the calls, otherwise the stale pickle would be used.
 
     :param objects: a sequence of objects to pickle
+    :param cache: if given, a dictionary id -> (obj, pickled) containing
+                  the objects of the previous call, replaced by the
+                  objects of the current call
     """
-    cache = {}
+    old = {} if cache is None else cache.copy()
+    new = {} if cache is None else cache
+    new.clear()  # drop the objects not repeated, to save memory
     out = []
     for obj in objects:
         obj_id = id(obj)
-        if obj_id not in cache:
-            if isinstance(obj, Pickled):  # already pickled
-                cache[obj_id] = obj
+        if obj_id not in new:
+            if obj_id in old:  # seen in the previous call
+                new[obj_id] = old[obj_id]
+            elif isinstance(obj, Pickled):  # already pickled
+                new[obj_id] = obj, obj
             else:  # pickle the object
-                cache[obj_id] = Pickled(obj)
-        out.append(cache[obj_id])
+                # keep a reference to the object, so that its id is not reused
+                new[obj_id] = obj, Pickled(obj)
+        out.append(new[obj_id][1])
     return out
 
 
@@ -400,25 +487,30 @@ class Result(object):
     """
     :param val: value to return or exception instance
     :param mon: Monitor instance
-    :param tb_str: traceback string (empty if there was no exception)
-    :param msg: message string (default empty)
+    :param tb_str: traceback string (None if there was no exception)
+    :param msg: message string (default None)
     """
-    func = None
+    # no instance dictionary, since a Result is sent for each output
+    __slots__ = ('pik', 'nbytes', 'func', 'mon', 'tb_str', 'msg', 'ended',
+                 'workerid')
 
-    def __init__(self, val, mon, tb_str='', msg=''):
+    def __init__(self, val, mon, tb_str=None, msg=None):
+        self.func = None
+        self.ended = False  # True for the last Result sent by a task
         if isinstance(val, dict):
             self.pik = Pickled(val)
-            self.nbytes = {k: len(Pickled(v)) for k, v in val.items()}
+            self.nbytes = {k: pickled_size(v) for k, v in val.items()}
         elif isinstance(val, tuple) and callable(val[0]):
             self.func = val[0]
             self.pik = pickle_sequence(val[1:])
-            self.nbytes = {'args': sum(len(p) for p in self.pik)}
+            self.nbytes = {'args': sum(p._len for p in self.pik)}
         elif msg == 'TASK_ENDED':
-            self.pik = Pickled(None)
+            self.pik = FakePickle(0)
             self.nbytes = {}
+            self.ended = True
         else:
             self.pik = Pickled(val)
-            self.nbytes = {'tot': len(self.pik)}
+            self.nbytes = {'tot': self.pik._len}
         self.mon = mon
         self.tb_str = tb_str
         self.msg = msg
@@ -471,13 +563,15 @@ class Result(object):
         return res
 
 
-def check_mem_usage(soft_percent=None, hard_percent=None):
+def check_mem_usage(soft_percent=None, hard_percent=None,
+                    used_mem_percent=None):
     """
     Display a warning if we are running out of memory
     """
     soft_percent = soft_percent or config.memory.soft_mem_limit
     hard_percent = hard_percent or config.memory.hard_mem_limit
-    used_mem_percent = psutil.virtual_memory().percent
+    if used_mem_percent is None:
+        used_mem_percent = psutil.virtual_memory().percent
     if used_mem_percent > hard_percent:
         raise MemoryError('Using more memory than allowed by configuration '
                           '(Used: %d%% / Allowed: %d%%)! Shutting down.' %
@@ -514,11 +608,29 @@ def sendback(res, zsocket):
         tb_str = ''.join(traceback.format_tb(tb))
         if DEBUG and calc_id:
             dblog('ERROR', calc_id, task_no, tb_str)
-        res = Result(exc, res.mon, tb_str)
-        zsocket.send(res)
+        err = Result(exc, res.mon, tb_str)
+        err.ended = res.ended
+        zsocket.send(err)
     return nbytes
 
 
+@functools.lru_cache(maxsize=128)
+def isgeneratorfunction(func):
+    """
+    Cached version of inspect.isgeneratorfunction, called for each task
+    """
+    return inspect.isgeneratorfunction(func)
+
+
+@functools.lru_cache(maxsize=16)
+def unpickle_monitor(pik):
+    """
+    Unpickle a monitor; since the workers receive the same pickled
+    monitor for all the tasks of a Starmap, it is unpickled only once
+    """
+    return pickle.loads(pik)
+
+
 def safely_call(func, args, task_no=0, mon=dummy_mon):
     """
     Call the given function with the given arguments safely, i.e.
@@ -530,9 +642,14 @@ def safely_call(func, args, task_no=0, mon=dummy_mon):
     :param func: the function to call
     :param args: the arguments
     :param task_no: the task number
-    :param mon: a monitor
+    :param mon: a monitor, possibly pickled
     """
-    isgenfunc = inspect.isgeneratorfunction(func)
+    if isinstance(mon, Pickled):
+        mon = unpickle_monitor(mon.pik)
+    try:
+        isgenfunc = isgeneratorfunction(func)
+    except TypeError:  # unhashable callable instance
+        isgenfunc = inspect.isgeneratorfunction(func)
     if hasattr(args[0], 'unpickle'):
         # args is a list of Pickled objects
         args = [a.unpickle() for a in args]
@@ -546,11 +663,14 @@ def safely_call(func, args, task_no=0, mon=dummy_mon):
         name = args[1].__name__
     else:
         name = func.__name__
-    mon = mon.new(operation='total ' + name, measuremem=True)
+    # the operation is the same for all the results of the task
+    mon = mon.new(operation=sys.intern('total ' + name), measuremem=True)
     mon.weight = getattr(args[0], 'weight', 1.)  # used in task_info
     mon.task_no = task_no
     if mon.inject:
         args += (mon,)
+    if isinstance(mon.backurl, list):  # one URL per PULL socket
+        mon.backurl = mon.backurl[task_no % len(mon.backurl)]
     sentbytes = 0
     if isgenfunc:
         with Socket(mon.backurl, zmq.PUSH, 'connect') as zsocket:
@@ -564,12 +684,9 @@ def safely_call(func, args, task_no=0, mon=dummy_mon):
                 sentbytes += sendback(res, zsocket)
     else:
         res = Result.new(func, args, mon)
-        # send back a single result and a TASK_ENDED
+        res.ended = True  # there is no need for a TASK_ENDED message
         with Socket(mon.backurl, zmq.PUSH, 'connect') as zsocket:
-            sentbytes += sendback(res, zsocket)
-            end = Result(None, mon, msg='TASK_ENDED')
-            end.pik = FakePickle(sentbytes)
-            zsocket.send(end)
+            sendback(res, zsocket)
 
 
 if oq_distribute() == 'ipp':
@@ -602,7 +719,8 @@ class IterResult(object):
         first_time = True
         self.counts = 0
         for result in self.iresults:
-            msg = check_mem_usage()
+            msg = check_mem_usage(
+                used_mem_percent=Starmap.mem_snapshot[1] or None)
             # log a warning if too much memory is used
             if msg and first_time:
                 logging.warning(msg)
@@ -652,7 +770,8 @@ class IterResult(object):
         return res
 
 
-def getargnames(task_func):
+@functools.lru_cache(maxsize=128)
+def _getargnames(task_func):
     # a task can be a function, a method, a class or a callable instance
     if inspect.isfunction(task_func):
         return inspect.getfullargspec(task_func).args
@@ -664,10 +783,21 @@ def getargnames(task_func):
         return inspect.getfullargspec(task_func.__call__).args[1:]
 
 
+def getargnames(task_func):
+    """
+    :returns: the names of the arguments of the task, cached
+    """
+    try:
+        return _getargnames(task_func)
+    except TypeError:  # unhashable callable instance
+        return _getargnames.__wrapped__(task_func)
+
+
 class Starmap(object):
     pids = ()
-    running_tasks = []  # currently running tasks
+    running_tasks = set()  # currently running tasks
     maxtasksperchild = None  # with 1 it hangs on the EUR calculation!
+    keep_alive = False  # if True, .shutdown() does not terminate the pool
     num_cores = int(config.distribution.get('num_cores', '0'))
     if not num_cores:
         # use only the "visible" cores, not the total system cores
@@ -677,10 +807,55 @@ class Starmap(object):
         except AttributeError:
             num_cores = psutil.cpu_count()
     CT = num_cores * 2
+    # number of PULL sockets receiving the results; each one takes a port
+    # in the range dbserver.receiver_ports, so more than one is opt-in
+    num_receivers = int(config.distribution.get('num_receivers', '1'))
+    # (memory used by the master and the workers in GB, used memory %)
+    # updated every second by the mem_sampler thread
+    mem_snapshot = (0., 0.)
+    mem_sampler = None
+    item_weight = None  # set by .apply, used to split the blocks further
+    # set it to True to pickle only once the arguments after the first one,
+    # if they are the same objects for all the tasks and are never mutated
+    share_args = False
+
+    @classmethod
+    def sample_memory(cls):
+        """
+        Update and return the memory snapshot
+        """
+        if sys.platform != 'darwin':
+            # it normally works on macOS, but not in notebooks calling
+            # notebooks, which is the case relevant for Marco Pagani
+            mem_gb = (memory_rss(os.getpid()) + sum(
+                memory_rss(pid) for pid in cls.pids)) / GB
+        else:
+            # measure only the memory used by the main process
+            mem_gb = memory_rss(os.getpid()) / GB
+        cls.mem_snapshot = mem_gb, psutil.virtual_memory().percent
+        return cls.mem_snapshot
+
+    @classmethod
+    def _sample_memory_forever(cls, delay=1.):
+        while True:
+            time.sleep(delay)
+            cls.sample_memory()
 
     @classmethod
     def init(cls, distribute=None):
         cls.distribute = distribute or oq_distribute()
+        if cls.mem_sampler is None:
+            # sample the memory in the background, to avoid a syscall
+            # per worker in the loop over the results
+            cls.sample_memory()
+            cls.mem_sampler = threading.Thread(
+                target=cls._sample_memory_forever, daemon=True)
+            cls.mem_sampler.start()
+        pool_key = cls.distribute, cls.num_cores, cls.maxtasksperchild
+        if (cls.distribute in ('processpool', 'threadpool') and
+                getattr(cls, 'pool_key', pool_key) != pool_key):
+            # a pool of a different kind or size is running, replace it
+            cls.shutdown(force=True)
         if cls.distribute == 'processpool' and not hasattr(cls, 'pool'):
             # unregister custom handlers before starting the processpool
             term_handler = signal.signal(signal.SIGTERM, signal.SIG_DFL)
@@ -692,18 +867,27 @@ class Starmap(object):
                 cls.num_cores, init_workers,
                 maxtasksperchild=cls.maxtasksperchild)
             cls.pids = [proc.pid for proc in cls.pool._pool]
+            cls.pool_key = pool_key
             # after spawning the processes restore the original handlers
             # i.e. the ones defined in openquake.engine.engine
             signal.signal(signal.SIGTERM, term_handler)
             signal.signal(signal.SIGINT, int_handler)
         elif cls.distribute == 'threadpool' and not hasattr(cls, 'pool'):
             cls.pool = multiprocessing.dummy.Pool(cls.num_cores)
+            cls.pool_key = pool_key
         elif cls.distribute == 'ipp' and not hasattr(cls, 'executor'):
             rc = Cluster(n=cls.num_cores).start_and_connect_sync()
             cls.executor = rc.executor()
 
     @classmethod
-    def shutdown(cls):
+    def shutdown(cls, force=False):
+        """
+        Terminate the pool, unless keep_alive is set and force is False;
+        `init` replaces it anyway if distribute, num_cores or
+        maxtasksperchild change
+        """
+        if cls.keep_alive and not force:
+            return
         # shutting down the pool during the runtime causes mysterious
         # race conditions with errors inside atexit._run_exitfuncs
         if hasattr(cls, 'pool'):
@@ -711,15 +895,16 @@ class Starmap(object):
             cls.pool.terminate()
             cls.pool.join()
             del cls.pool
+            del cls.pool_key
             cls.pids = []
         elif hasattr(cls, 'executor'):
             cls.executor.shutdown()
+            del cls.executor
 
     @classmethod
     def apply(cls, task, allargs, concurrent_tasks=None,
               maxweight=None, weight=lambda item: 1,
-              key=lambda item: 'Unspecified',
-              distribute=None, progress=logging.info, h5=None):
+              key=nokey, distribute=None, progress=logging.info, h5=None):
         r"""
         Apply a task to a tuple of the form (sequence, \*other_args)
         by first splitting the sequence in chunks, according to the weight
@@ -746,13 +931,14 @@ class Starmap(object):
                 concurrent_tasks = cls.CT
             taskargs = [[blk] + args for blk in split_in_blocks(
                 arg0, concurrent_tasks or 1, weight, key)]
-        return cls(task, taskargs, distribute, progress, h5)
+        smap = cls(task, taskargs, distribute, progress, h5)
+        smap.item_weight = weight  # the blocks can be split further
+        return smap
 
     def apply_split(cls, task, allargs, concurrent_tasks=None,
                     maxweight=None, weight=lambda item: 1,
-                    key=lambda item: 'Unspecified',
-                    distribute=None, progress=logging.info, h5=None,
-                    duration=300, outs_per_task=5):
+                    key=nokey, distribute=None, progress=logging.info,
+                    h5=None, duration=300, outs_per_task=5):
         """
         Same as Starmap.apply, but possibly produces subtasks
         """
@@ -782,13 +968,15 @@ class Starmap(object):
         self.task_args = task_args
         self.progress = progress
         self.h5 = h5
-        self.task_queue = []
+        self.task_queue = collections.deque()
         try:
             self.num_tasks = len(self.task_args)
         except TypeError:  # generators have no len
             self.num_tasks = None
         self.argnames = getargnames(task_func)
         self.sent = AccumDict(accum=AccumDict())  # fname -> argname -> nbytes
+        # fname -> (argnames, nbytes array), updated at each submit
+        self.sent_bytes = {}
         self.monitor.inject = (self.argnames[-1].startswith('mon') or
                                self.argnames[-1].endswith('mon'))
         self.receiver = 'tcp://0.0.0.0:%s' % config.dbserver.receiver_ports
@@ -799,7 +987,10 @@ class Starmap(object):
                 config.dbserver.receiver_host or socket.gethostname())
             logging.debug(f'{self.return_ip=}')
         self.monitor.backurl = None  # overridden later
-        self.tasks = []  # populated by .submit
+        self.tasks = set()  # populated by .submit
+        self.pending = []  # tasks to send to the zmq workerpools
+        self.pik_cache = {}  # id -> (obj, pickled) for the shared arguments
+        self.mon_pik = None  # (operation, pickled monitor)
         self.task_no = 0
         self.t0 = time.time()
 
@@ -817,19 +1008,35 @@ class Starmap(object):
             self.progress('%s %3d%% [%d submitted, %d queued]',
                           self.name, percent, self.task_no, queued)
             self.prev_percent = percent
+            self.save_task_sent()
         return done
 
+    def save_task_sent(self):
+        """
+        Update .sent from the counters and store it in task_sent
+        """
+        for fname, (argnames, nbytes) in self.sent_bytes.items():
+            self.sent[fname] = AccumDict(zip(argnames, nbytes.tolist()))
+        task_sent = ast.literal_eval(decode(self.h5['task_sent'][()]))
+        task_sent.update(self.sent)
+        del self.h5['task_sent']
+        self.h5['task_sent'] = str(task_sent)
+
     def submit(self, args, func=None):
         """
-        Submit the given arguments to the underlying task
+        Submit the given arguments to the underlying task.
+        NB: the arguments after the first one are pickled only once
+        if they are the same objects as in the previous submit, so they
+        must not be mutated between submits.
         """
-        func = func or self.task_func
-        if not hasattr(self, 'socket'):  # setup the PULL socket the first time
+        if not hasattr(self, 'sockets'):  # setup the PULL sockets
             self.t0 = time.time()
             self.__class__.running_tasks = self.tasks
-            self.socket = Socket(self.receiver, zmq.PULL, 'bind').__enter__()
-            self.monitor.backurl = 'tcp://%s:%s' % (
-                self.return_ip, self.socket.port)
+            self.sockets = [Socket(self.receiver, zmq.PULL, 'bind').__enter__()
+                            for _ in range(self.num_receivers)]
+            # the results of task_no are sent to backurl[task_no % K]
+            self.monitor.backurl = ['tcp://%s:%s' % (self.return_ip, sock.port)
+                                    for sock in self.sockets]
             self.monitor.config = config
         OQ_TASK_NO = os.environ.get('OQ_TASK_NO')
         if OQ_TASK_NO is not None and self.task_no != int(OQ_TASK_NO):
@@ -840,18 +1047,68 @@ class Starmap(object):
             pickled = isinstance(args[0], Pickled)
             if not pickled:
                 assert not isinstance(args[-1], Monitor)  # sanity check
-                args = pickle_sequence(args)
-            if func is None:
+                if self.share_args:  # pickle the shared arguments once
+                    args = (pickle_sequence(args[:1]) +
+                            pickle_sequence(args[1:], self.pik_cache))
+                else:
+                    args = pickle_sequence(args)
+            if func is None or func is self.task_func:  # precomputed
                 fname = self.task_func.__name__
                 argnames = self.argnames[:-1]
             else:
                 fname = func.__name__
                 argnames = getargnames(func)[:-1]
-            self.sent[fname] += {a: len(p) for a, p in zip(argnames, args)}
-        submit[dist](self, func, args, self.monitor)
-        self.tasks.append(self.task_no)
+            if fname not in self.sent_bytes:
+                self.sent_bytes[fname] = argnames, numpy.zeros(
+                    len(argnames), numpy.int64)
+            n = min(len(argnames), len(args))
+            self.sent_bytes[fname][1][:n] += [p._len for p in args[:n]]
+        func = func or self.task_func
+        if dist in ('processpool', 'zmq', 'ipp'):
+            submit[dist](self, func, args, self.pickled_monitor())
+        else:
+            submit[dist](self, func, args, self.monitor)
+        self.tasks.add(self.task_no)
         self.task_no += 1
 
+    def pickled_monitor(self):
+        """
+        :returns: the monitor pickled once, unless its operation changes
+        """
+        operation = self.monitor.operation  # changed by submit_split
+        if self.mon_pik is None or self.mon_pik[0] != operation:
+            self.mon_pik = operation, Pickled(self.monitor)
+        return self.mon_pik[1]
+
+    def flush(self):
+        """
+        Send the pending tasks to the process pool in chunks or to the
+        workerpools, one batch per host. With multiple hosts the batches
+        are pickled and sent in parallel threads, so that pickling
+        overlaps with waiting for the replies.
+        """
+        if not self.pending:
+            return
+        elif self.distribute == 'processpool':
+            # NB: starmap_async consumes the list lazily, so it must not
+            # be cleared; the first CT tasks go in chunks of 2 per core
+            pending, self.pending = self.pending, []
+            chunksize = max(1, len(pending) // self.num_cores)
+            self.pool.starmap_async(safely_call, pending, chunksize)
+            return
+        batches = AccumDict(accum=[])  # host -> tasks
+        for task in self.pending:
+            idx = task[2] % len(host_cores)  # task_no % num_hosts
+            batches[host_cores[idx].split()[0]].append(task)
+        self.pending.clear()
+        if len(batches) > 1:
+            if not hasattr(self, 'sender'):  # one thread per host
+                self.sender = multiprocessing.dummy.Pool(len(host_cores))
+            self.sender.starmap(zmq_send, batches.items())
+        else:
+            for host, tasks in batches.items():
+                zmq_send(host, tasks)
+
     def submit_split(self, args,  duration, outs_per_task):
         """
         Submit the given arguments to the underlying task
@@ -869,8 +1126,8 @@ class Starmap(object):
             for args in self.task_args:
                 self.submit(args)
         else:  # build a task queue in advance
-            self.task_queue = [(self.task_func, args)
-                               for args in self.task_args]
+            self.task_queue = collections.deque(
+                (self.task_func, args) for args in self.task_args)
         dist = 'no' if self.num_tasks == 1 else self.distribute
         if dist == 'slurm':
             for func, args in self.task_queue:
@@ -894,13 +1151,34 @@ class Starmap(object):
     def __iter__(self):
         return iter(self.submit_all())
 
+    def _split_queue(self, durations):
+        # halve the blocks of the queued tasks if the durations of the
+        # first tasks are very irregular, to reduce the slow tasks at the end
+        mean = numpy.mean(durations)
+        if not mean or numpy.std(durations) / mean <= .5:
+            return
+        queue = []
+        for func, args in self.task_queue:
+            blk = args[0]
+            if (func is self.task_func and len(blk) > 1 and
+                    isinstance(blk, (list, WeightedSequence))):
+                for half in halve(blk, self.item_weight):
+                    queue.append((func, [half] + list(args[1:])))
+            else:
+                queue.append((func, args))
+        if len(queue) > len(self.task_queue):
+            logging.info('Irregular %s tasks, splitting %d queued tasks '
+                         'into %d', self.name, len(self.task_queue),
+                         len(queue))
+            self.task_queue = collections.deque(queue)
+
     def _submit_many(self, howmany):
         for _ in range(howmany):
             if self.task_queue:
-                # remove in LIFO order
-                func, args = self.task_queue[0]
-                del self.task_queue[0]
+                # remove in FIFO order
+                func, args = self.task_queue.popleft()
                 self.submit(args, func=func)
+        self.flush()
 
     def _loop(self):
         self.busytime = AccumDict(accum=[])  # pid -> time
@@ -910,59 +1188,73 @@ class Starmap(object):
             sbatch(self.monitor)
                 
         elif self.task_queue:
-            first_args = self.task_queue[:self.CT]
-            self.task_queue[:] = self.task_queue[self.CT:]
-            for func, args in first_args:
-                self.submit(args, func=func)
+            self._submit_many(self.CT)
+        self.flush()
 
-        if not hasattr(self, 'socket'):  # no submit was ever made
+        if not hasattr(self, 'sockets'):  # no submit was ever made
             return ()
 
-        nbytes = sum(self.sent[self.task_func.__name__].values())
+        fname = self.task_func.__name__
+        nbytes = (self.sent_bytes[fname][1].sum()
+                  if fname in self.sent_bytes else 0)
         if nbytes > 1E5:
             logging.info('Sent %d %s tasks, %s in %d seconds', len(self.tasks),
                          self.name, humansize(nbytes), time.time() - self.t0)
 
-        isocket = iter(self.socket)  # read from the PULL socket
-        finished = set()
-        while self.tasks:
+        isocket = iter_sockets(self.sockets)  # read from the PULL sockets
+        durations = []  # of the first ended tasks
+        refill = 0  # number of tasks to submit, one per ended task/subtask
+        while self.tasks or refill and self.task_queue:
+            if refill and (refill >= self.num_cores or not (
+                    self.tasks and any(
+                        sock.zsocket.poll(0) for sock in self.sockets))):
+                # the messages arrived in a burst have been consumed or
+                # many workers are free: submit the new tasks together
+                self._submit_many(refill)
+                refill = 0
             self.log_percent()
             res = next(isocket)
             if self.calc_id != res.mon.calc_id:
                 logging.warning('Discarding a result from job %s, since this '
                                 'is job %s', res.mon.calc_id, self.calc_id)
-            elif res.msg == 'TASK_ENDED':
-                finished.add(res.mon.task_no)
+                continue
+            if res.ended:  # the last message of the task
                 self.busytime += {res.workerid: res.mon.duration}
                 self.tasks.remove(res.mon.task_no)
-                self._submit_many(1)
-                todo = set(range(self.task_no)) - finished
-                logging.debug('%d tasks todo %s', len(todo),
-                              shortlist(sorted(todo)))
-                task_sent = ast.literal_eval(decode(self.h5['task_sent'][()]))
-                task_sent.update(self.sent)
-                del self.h5['task_sent']
-                self.h5['task_sent'] = str(task_sent)
+                refill += 1
+                if self.item_weight and len(durations) < 10:
+                    durations.append(res.mon.duration)
+                    if len(durations) == 10:
+                        self._split_queue(durations)
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug('%d tasks todo %s', len(self.tasks),
+                                  shortlist(sorted(self.tasks)))
                 name = res.mon.operation[6:]  # strip 'total '
                 n = self.name + ':' + name if name == 'split_task' else name
-                if sys.platform != 'darwin':
-                    # it normally works on macOS, but not in notebooks calling
-                    # notebooks, which is the case relevant for Marco Pagani
-                    mem_gb = (memory_rss(os.getpid()) + sum(
-                        memory_rss(pid) for pid in Starmap.pids)) / GB
-                else:
-                    # measure only the memory used by the main process
-                    mem_gb = memory_rss(os.getpid()) / GB
+                mem_gb = self.mem_snapshot[0]
                 res.mon.save_task_info(self.h5, res, n, mem_gb)
                 res.mon.flush(self.h5)
+            if res.msg == 'TASK_ENDED':
+                pass
             elif res.func:  # add subtask
-                self.task_queue.append((res.func, res.pik))
-                self._submit_many(1)
+                # the subtasks come from a slow task: put them in front
+                # of the queue, so that the free workers take them first
+                self.task_queue.appendleft((res.func, res.pik))
+                refill += 1
             else:
+                if refill:  # do not keep the free workers waiting
+                    self._submit_many(refill)
+                    refill = 0
                 yield res
         self.log_percent()
-        self.socket.__exit__(None, None, None)
+        self.save_task_sent()
+        for sock in self.sockets:
+            sock.__exit__(None, None, None)
         self.tasks.clear()
+        self.pik_cache.clear()
+        if hasattr(self, 'sender'):
+            self.sender.close()
+            del self.sender
         if dist == 'slurm':
             for fname in os.listdir(self.monitor.calc_dir):
                 os.remove(os.path.join(self.monitor.calc_dir, fname))
@@ -973,10 +1265,29 @@ class Starmap(object):
                 times.mean(), times.std(), times.min(), times.max())
 
 
+atexit.register(Starmap.shutdown, force=True)
+
+
+def halve(block, weight):
+    """
+    :param block: a list or a WeightedSequence with at least 2 elements
+    :param weight: function returning the weight of an item
+    :returns: two halves of the block with similar weights, of the same type
+    """
+    weights = [weight(item) for item in block]
+    cumweights = numpy.cumsum(weights)
+    # the first half contains the items up to half of the total weight
+    n = numpy.searchsorted(cumweights, cumweights[-1] / 2) + 1
+    n = min(max(n, 1), len(block) - 1)
+    if isinstance(block, WeightedSequence):
+        return (WeightedSequence(zip(block[:n], weights[:n])),
+                WeightedSequence(zip(block[n:], weights[n:])))
+    return block[:n], block[n:]
+
+
 def sequential_apply(task, args, concurrent_tasks=Starmap.CT,
                      maxweight=None, weight=lambda item: 1,
-                     key=lambda item: 'Unspecified',
-                     progress=logging.info):
+                     key=nokey, progress=logging.info):
     """
     Apply sequentially task to args by splitting args[0] in blocks
     """
@@ -1020,9 +1331,18 @@ def split_task(elements, func, args, duration, outs_per_task, monitor):
         yield res
         if dt > duration:
             # spawn subtasks for the rest and exit, used in classical/case_14
-            for els in split_elems[i + 1:]:
+            # the weights of the remaining elements are computed once
+            # and summed per split in C
+            splits = idxs % outs_per_task
+            rest = splits > i
+            weights = numpy.fromiter(
+                (getattr(el, 'weight', 1.) for el in elements[rest]),
+                float, rest.sum())
+            split_weights = numpy.bincount(
+                splits[rest], weights, outs_per_task)
+            for els, w in zip(split_elems[i + 1:], split_weights[i + 1:]):
                 ls = List(els)
-                ls.weight = sum(getattr(el, 'weight', 1.) for el in els)
+                ls.weight = float(w)
                 yield (func, ls) + args
             break
 
@@ -170,6 +170,16 @@ def memory_rss(pid):
 
 
 # this is not thread-safe
+def _read(f, key, slc):
+    # read an object stored by Monitor.save
+    dset = f[key]
+    if '__pdcolumns__' in dset.attrs:
+        return f.read_df(key, slc=slc)
+    elif dset.shape:
+        return dset[slc]
+    return pickle.loads(dset[()])
+
+
 class Monitor(object):
     """
     Measure the resident memory occupied by a list of processes during
@@ -359,20 +369,26 @@ class Monitor(object):
                 f[key] = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
         return True
 
-    def read(self, key, slc=slice(None)):
+    def open_tmp(self):
+        """
+        :returns: the _tmp.hdf5 file open in read mode, to be passed to
+                  .read so that the file is not reopened at every call
+        """
+        # a larger chunk cache, since the assets are read in slices
+        return hdf5.File(self.filename[:-5] + '_tmp.hdf5', 'r',
+                         rdcc_nbytes=hdf5.RDCC_NBYTES)
+
+    def read(self, key, slc=slice(None), h5=None):
         """
         :param key: key in the _tmp.hdf5 file
         :param slc: slice to read (default all)
+        :param h5: the file returned by .open_tmp, if any
         :return: unpickled object
         """
-        tmp = self.filename[:-5] + '_tmp.hdf5'
-        with hdf5.File(tmp, 'r') as f:
-            dset = f[key]
-            if '__pdcolumns__' in dset.attrs:
-                return f.read_df(key, slc=slc)
-            elif dset.shape:
-                return dset[slc]
-            return pickle.loads(dset[()])
+        if h5 is not None:
+            return _read(h5, key, slc)
+        with self.open_tmp() as f:
+            return _read(f, key, slc)
 
     def iter(self, genobj):
         """
@@ -24,6 +24,7 @@ import shutil
 import unittest
 import itertools
 import tempfile
+import pickle
 import numpy
 import sys
 from openquake.baselib import parallel, general, hdf5, performance
@@ -90,6 +91,25 @@ class StarmapTestCase(unittest.TestCase):
         partial_sums = sorted(dic['n'] for dic in res)
         self.assertEqual(partial_sums, [1, 2, 2])
 
+    def test_split_queue(self):
+        smap = parallel.Starmap.apply(
+            get_length, (numpy.arange(20),), concurrent_tasks=5)
+        smap.task_queue = [(get_length, args) for args in smap.task_args]
+        smap._split_queue([1] * 10)  # regular durations, nothing to do
+        self.assertEqual(len(smap.task_queue), 5)
+        smap._split_queue([1] * 9 + [20])  # irregular durations
+        self.assertEqual([len(args[0]) for _, args in smap.task_queue],
+                         [2] * 10)
+        self.assertEqual(smap.task_queue[0][1][0].weight, 2)
+
+    def test_halve(self):
+        # the blocks are halved by cumulative weight
+        blk = general.WeightedSequence([(10, 10), (1, 1), (2, 2), (3, 3)])
+        first, second = parallel.halve(blk, lambda item: item)
+        self.assertEqual(list(first), [10])
+        self.assertEqual(list(second), [1, 2, 3])
+        self.assertEqual((first.weight, second.weight), (10, 6))
+
     def test_spawn(self):
         all_data = [
             ('a', list(range(10))), ('b', list(range(20))),
@@ -146,6 +166,73 @@ class StarmapTestCase(unittest.TestCase):
         parallel.Starmap.shutdown()
 
 
+class PickledTestCase(unittest.TestCase):
+    def test_out_of_band(self):
+        arr = numpy.arange(1000.)
+        pik = parallel.Pickled({'arr': arr})
+        self.assertEqual(len(pik.buffers), 1)  # the array data
+        self.assertGreaterEqual(len(pik), arr.nbytes)
+        # roundtrip with protocol 5 and with the multiprocessing protocol
+        for protocol in (5, 4):
+            val = pickle.loads(pickle.dumps(pik, protocol)).unpickle()
+            numpy.testing.assert_equal(val['arr'], arr)
+            self.assertTrue(val['arr'].flags.writeable)
+        # with protocol 4 the buffers are copied only the first time
+        [buf] = pik.buffers
+        pickle.dumps(pik, 4)
+        self.assertIs(pik.buffers[0], buf)
+
+    def test_result_frames(self):
+        # the arrays in a Result are sent as separated zmq frames
+        arr = numpy.arange(10000.)
+        res = parallel.Result({'arr': arr}, parallel.dummy_mon)
+        buffers = []
+        data = pickle.dumps(res, 5, buffer_callback=buffers.append)
+        self.assertEqual([memoryview(buf).nbytes for buf in buffers],
+                         [arr.nbytes])
+        self.assertLess(len(data), 10000)  # the array data is not there
+        res = pickle.loads(data, buffers=buffers)
+        numpy.testing.assert_equal(res.get()['arr'], arr)
+
+    def test_big_pickle_frame(self):
+        # a big pickled bytestring is sent as a separated zmq frame too
+        lst = list(range(100000))
+        res = parallel.Result(lst, parallel.dummy_mon)
+        buffers = []
+        data = pickle.dumps(res, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), 10000)
+        res = pickle.loads(data, buffers=buffers)
+        self.assertEqual(res.get(), lst)
+        # the received Pickled can be sent again with protocol 4
+        pik = pickle.loads(pickle.dumps(res.pik, 4))
+        self.assertEqual(pik.unpickle(), lst)
+
+    def test_pickled_size(self):
+        arr = numpy.arange(100.)
+        self.assertEqual(parallel.pickled_size(arr), arr.nbytes)
+        objs = numpy.array(['x' * 100] * 10, object)
+        self.assertGreater(parallel.pickled_size(objs), objs.nbytes)
+
+    def test_pickle_sequence_cache(self):
+        cache = {}
+        lst = [1, 2, 3]
+        p1, p2 = parallel.pickle_sequence([lst, lst], cache)
+        [p3] = parallel.pickle_sequence([lst], cache)
+        self.assertIs(p1, p2)
+        self.assertIs(p1, p3)  # pickled only once
+        parallel.pickle_sequence([[4]], cache)
+        self.assertEqual(len(cache), 1)  # lst is not repeated, dropped
+
+    def test_pickled_monitor(self):
+        mon = performance.Monitor('test')
+        pik = parallel.Pickled(mon)
+        mon1 = parallel.unpickle_monitor(pik.pik)
+        mon2 = parallel.unpickle_monitor(pik.pik)
+        self.assertIs(mon1, mon2)  # unpickled only once
+        self.assertEqual(mon1.operation, 'test')
+
+
 class ThreadPoolTestCase(unittest.TestCase):
     @unittest.skipIf(
         sys.platform == 'darwin' and platform.processor() == 'i386',
@@ -206,11 +206,11 @@ class WorkerMaster(object):
 
 def get_results(socket, n):
     for res in socket:
-        if n == 0:
-            return
-        elif res.msg != 'TASK_ENDED':
+        if res.msg != 'TASK_ENDED':
             yield res.get()
             n -= 1
+            if n == 0:
+                return
 
 
 def debug_task(msg, mon):
@@ -285,17 +285,27 @@ class WorkerPool(object):
                     elif cmd == 'get_executing':
                         executing = sorted(os.listdir(self.executing))
                         ctrlsock.send(' '.join(executing))
-                    elif isinstance(cmd, tuple):
-                        func, args, taskno, mon = cmd
-                        self.pool.apply_async(
-                            call, cmd + (self.executing,),
-                            error_callback=functools.partial(errback, mon.calc_id, taskno))
+                    elif isinstance(cmd, tuple):  # single task
+                        self.submit(cmd)
+                        ctrlsock.send('submitted')
+                    elif isinstance(cmd, list):  # batch of tasks
+                        for task in cmd:
+                            self.submit(task)
                         ctrlsock.send('submitted')
                     else:
                         ctrlsock.send('unknown command')
         finally:
             shutil.rmtree(self.executing)
 
+    def submit(self, task):
+        """
+        Submit a task (func, args, taskno, mon) to the pool
+        """
+        func, args, taskno, mon = task
+        self.pool.apply_async(
+            call, task + (self.executing,),
+            error_callback=functools.partial(errback, mon.calc_id, taskno))
+
     def stop(self):
         """
         Terminate the pool
@@ -31,6 +31,7 @@ with Socket('tcp://0.0.0.0:8000', zmq.REP, 'bind') as sock:
 """
 import re
 import zmq
+import pickle
 import time
 import logging
 
@@ -74,6 +75,29 @@ def connect(end_point, socket_type):
     return sock
 
 
+def iter_sockets(sockets):
+    """
+    Iterate on the objects received by a set of zmq.PULL/zmq.REP sockets,
+    polling all of them together. Exits if SIGTERM is sent.
+
+    :param sockets: a list of :class:`Socket` instances already entered
+    """
+    poller = zmq.Poller()
+    for sock in sockets:
+        poller.register(sock.zsocket, zmq.POLLIN)
+    socks = {sock.zsocket: sock for sock in sockets}
+    while True:
+        try:
+            ready = poller.poll(sockets[0].timeout)
+            if not ready:
+                logging.debug('Waiting on %s', sockets)
+            for zsocket, _event in ready:
+                yield socks[zsocket].recv()
+        except zmq.ZMQError:
+            # sending SIGTERM raises ZMQError
+            break
+
+
 class Socket(object):
     """
     A Socket class to be used with code like the following::
@@ -153,23 +177,35 @@ class Socket(object):
         while self.running:
             try:
                 if self.zsocket.poll(self.timeout):
-                    yield self.zsocket.recv_pyobj()
+                    yield self.recv()
                 elif self.socket_type == zmq.PULL:
                     logging.debug('Waiting on %s:%d', self, self.port)
             except zmq.ZMQError:
                 # sending SIGTERM raises ZMQError
                 break
 
+    def recv(self):
+        """
+        Receive a multipart message and unpickle it; the frames after the
+        first one are the out-of-band buffers and are not copied.
+        """
+        frames = self.zsocket.recv_multipart(copy=False)
+        return pickle.loads(frames[0].buffer, buffers=frames[1:])
+
     def send(self, obj):
         """
         Send an object to the remote server; block and return the reply
-        if the socket type is REQ.
+        if the socket type is REQ. The object is pickled with protocol 5
+        and the out-of-band buffers (i.e. the data of numpy arrays)
+        are sent as separated frames without copying them.
 
         :param obj:
             the Python object to send
         """
+        buffers = []
         try:
-            self.zsocket.send_pyobj(obj)
+            data = pickle.dumps(obj, 5, buffer_callback=buffers.append)
+            self.zsocket.send_multipart([data] + buffers, copy=False)
         except Exception as exc:
             # usual for objects bigger than 4 GB
             raise exc.__class__('%s: %r' % (exc, obj))
@@ -179,7 +215,7 @@ class Socket(object):
             if not ok:
                 raise TimeoutError('While sending %r to %s' %
                                    (obj, self.end_point))
-            return self.zsocket.recv_pyobj()
+            return self.recv()
 
     def __repr__(self):
         return '<%s %s %s>' % (self.__class__.__name__,
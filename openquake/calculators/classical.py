@@ -169,8 +169,10 @@ def postclassical(pgetter, N, hstats, individual_rlzs,
     S = len(hstats)
     pmap_by_kind = {}
     if R == 1 or individual_rlzs:
-        pmap_by_kind['hcurves-rlzs'] = [
-            ProbabilityMap(sids, M, L1).fill(0) for r in range(R)]
+        # a single array for all the realizations, the pmaps are views
+        rlzs = numpy.zeros((R, len(sids), M, L1))
+        pmap = ProbabilityMap(sids, M, L1)
+        pmap_by_kind['hcurves-rlzs'] = [pmap.new(rlzs[r]) for r in range(R)]
     if hstats:
         pmap_by_kind['hcurves-stats'] = [
             ProbabilityMap(sids, M, L1).fill(0) for r in range(S)]
@@ -189,9 +191,7 @@ def postclassical(pgetter, N, hstats, individual_rlzs,
             continue
         with compute_mon:
             if R == 1 or individual_rlzs:
-                for r in range(R):
-                    pmap_by_kind['hcurves-rlzs'][r].array[idx] = (
-                        pc.array[:, r].reshape(M, L1))
+                rlzs[:, idx] = pc.array.T.reshape(R, M, L1)
             if hstats:
                 for s, (statname, stat) in enumerate(hstats.items()):
                     sc = getters.build_stat_curve(
@@ -207,6 +207,10 @@ def postclassical(pgetter, N, hstats, individual_rlzs,
         with hmaps_mon:
             pmap_by_kind['hmaps-stats'] = calc.make_hmaps(
                 pmap_by_kind['hcurves-stats'], imtls, poes)
+    # the curves and maps are stored as float32, so they are sent as such
+    for pmaps in pmap_by_kind.values():
+        for pmap in pmaps:
+            pmap.array = F32(pmap.array)
     return pmap_by_kind
 
 
@@ -600,8 +604,7 @@ class ClassicalCalculator(base.HazardCalculator):
                 dset = self.datastore.getitem(kind)
                 array = self.hazard[kind] = numpy.zeros(dset.shape, dset.dtype)
             for r, pmap in enumerate(pmaps):
-                for idx, sid in enumerate(pmap.sids):
-                    array[sid, r] = pmap.array[idx]  # shape (M, P)
+                array[pmap.sids, r] = pmap.array  # shape (N, M, P)
 
     def post_execute(self, dummy):
         """
@@ -712,8 +715,8 @@ class ClassicalCalculator(base.HazardCalculator):
              N, hstats, individual, oq.max_sites_disagg, self.amplifier)
             for slices in allslices]
         self.hazard = {}  # kind -> array
-        hcbytes = 8 * N * S * M * L1
-        hmbytes = 8 * N * S * M * P if oq.poes else 0
+        hcbytes = 4 * N * S * M * L1
+        hmbytes = 4 * N * S * M * P if oq.poes else 0
         if hcbytes:
             logging.info('Producing %s of hazard curves', humansize(hcbytes))
         if hmbytes:
@@ -194,12 +194,13 @@ def event_based_risk(df, oqparam, monitor):
     :param monitor: a Monitor instance
     :returns: a dictionary of arrays
     """
-    with monitor('reading crmodel', measuremem=True):
-        crmodel = monitor.read('crmodel')
-        ideduc = monitor.read('assets/ideductible')
-        aggids = monitor.read('aggids')
-        rlz_id = monitor.read('rlz_id')
-        weights = [1] if oqparam.collect_rlzs else monitor.read('weights')
+    with monitor('reading crmodel', measuremem=True), monitor.open_tmp() as h5:
+        crmodel = monitor.read('crmodel', h5=h5)
+        ideduc = monitor.read('assets/ideductible', h5=h5)
+        aggids = monitor.read('aggids', h5=h5)
+        rlz_id = monitor.read('rlz_id', h5=h5)
+        weights = [1] if oqparam.collect_rlzs else monitor.read(
+            'weights', h5=h5)
 
     ARK = (oqparam.A, len(weights), oqparam.K)
     if oqparam.ignore_master_seed or oqparam.ignore_covs:
@@ -226,20 +227,22 @@ def gen_outputs(df, crmodel, rng, monitor):
     fil_mon = monitor('filtering GMFs', measuremem=False)
     ass_mon = monitor('reading assets', measuremem=False)
     sids = df.sid.to_numpy()
-    for s0, s1 in monitor.read('start-stop'):
-        with ass_mon:
-            assets = monitor.read('assets', slice(s0, s1)).set_index('ordinal')
-        for taxo in assets.taxonomy.unique():
-            adf = assets[assets.taxonomy == taxo]
-            with fil_mon:
-                # *crucial* for the performance of the next step
-                gmf_df = df[numpy.isin(sids, adf.site_id.unique())]
-            if len(gmf_df) == 0:  # common enough
-                continue
-            with mon_risk:
-                out = crmodel.get_output(
-                    adf, gmf_df, crmodel.oqparam._sec_losses, rng)
-            yield out
+    with monitor.open_tmp() as h5:  # read the assets without reopening it
+        for s0, s1 in monitor.read('start-stop', h5=h5):
+            with ass_mon:
+                assets = monitor.read(
+                    'assets', slice(s0, s1), h5).set_index('ordinal')
+            for taxo in assets.taxonomy.unique():
+                adf = assets[assets.taxonomy == taxo]
+                with fil_mon:
+                    # *crucial* for the performance of the next step
+                    gmf_df = df[numpy.isin(sids, adf.site_id.unique())]
+                if len(gmf_df) == 0:  # common enough
+                    continue
+                with mon_risk:
+                    out = crmodel.get_output(
+                        adf, gmf_df, crmodel.oqparam._sec_losses, rng)
+                yield out
 
 
 def set_oqparam(oq, assetcol, dstore):
@@ -1215,8 +1215,11 @@ def extract_mean_rates_by_src(dstore, what):
     L1, Ns = rates.shape
     arr = numpy.zeros(len(src_id), [('src_id', hdf5.vstr), ('rate', '<f8')])
     arr['src_id'] = src_id
-    arr['rate'] = [numpy.interp(iml, oq.imtls[imt], rates[:, i])
-                   for i in range(Ns)]
+    # the interpolation is linear in the rates, so the weights of the
+    # levels are computed once and applied to all the sources together
+    weights = [numpy.interp(iml, oq.imtls[imt], row)
+               for row in numpy.eye(L1)]
+    arr['rate'] = weights @ rates
     arr.sort(order='rate')
     return ArrayWrapper(arr[::-1], dict(site_id=site_id, imt=imt, iml=iml))
 
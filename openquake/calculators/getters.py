@@ -190,7 +190,7 @@ class PmapGetter(object):
         if self._pmap:
             return self._pmap
         G = len(self.trt_rlzs)
-        with hdf5.File(self.filename) as dstore:
+        with hdf5.File(self.filename, rdcc_nbytes=hdf5.RDCC_NBYTES) as dstore:
             for start, stop in self.slices:
                 rates_df = dstore.read_df('_rates', slc=slice(start, stop))
                 for sid, df in rates_df.groupby('sid'):
@@ -138,11 +138,8 @@ def make_hmaps(pmaps, imtls, poes):
     for pmap in pmaps:
         hmap = probability_map.ProbabilityMap(pmaps[0].sids, M, P).fill(0)
         for m, imt in enumerate(imtls):
-            data = probability_map.compute_hazard_maps(
+            hmap.array[:, m] = probability_map.compute_hazard_maps(
                 pmap.array[:, m], imtls[imt], poes)  # (N, P)
-            for idx, imls in enumerate(data):
-                for p, iml in enumerate(imls):
-                    hmap.array[idx, m, p] = iml
         hmaps.append(hmap)
     return hmaps
 
@@ -40,8 +40,14 @@ def hdf5new(datadir=None):
     if not os.path.exists(datadir):
         os.makedirs(datadir)
     calc_id = get_last_calc_id(datadir) + 1
-    fname = os.path.join(datadir, 'calc_%d.hdf5' % calc_id)
-    new = hdf5.File(fname, 'w')
+    while True:
+        fname = os.path.join(datadir, 'calc_%d.hdf5' % calc_id)
+        try:  # atomic creation, fails if another process took the ID
+            new = hdf5.File(fname, 'x')
+        except FileExistsError:
+            calc_id += 1
+        else:
+            break
     new.path = fname
     performance.init_performance(new)
     return new
@@ -544,7 +550,7 @@ class DataStore(collections.abc.MutableMapping):
     def __len__(self):
         if self.hdf5 == ():  # closed
             return 1
-        return sum(1 for f in self.hdf5)
+        return len(self.hdf5)
 
     def __hash__(self):
         return self.calc_id
@@ -33,6 +33,7 @@ LEVELS = {'debug': logging.DEBUG,
           'error': logging.ERROR,
           'critical': logging.CRITICAL}
 CALC_REGEX = r'(calc|cache)_(\d+)\.hdf5'
+_calc_re = re.compile(CALC_REGEX + '$')
 MODELS = []  # to be populated in get_tag
 
 
@@ -105,15 +106,17 @@ def get_calc_ids(datadir=None):
     """
     Extract the available calculation IDs from the datadir, in order.
     """
-    datadir = datadir or get_datadir()
-    if not os.path.exists(datadir):
-        return []
-    calc_ids = set()
-    for f in os.listdir(datadir):
-        mo = re.match(CALC_REGEX, f)
-        if mo:
-            calc_ids.add(int(mo.group(2)))
-    return sorted(calc_ids)
+    return sorted(_calc_ids(datadir or get_datadir()))
+
+
+def _calc_ids(datadir):
+    # set of calculation IDs in the datadir; scandir does not stat the files
+    try:
+        with os.scandir(datadir) as entries:
+            matches = (_calc_re.match(entry.name) for entry in entries)
+            return {int(mo.group(2)) for mo in matches if mo}
+    except FileNotFoundError:
+        return set()
 
 
 def get_last_calc_id(datadir=None):
@@ -121,11 +124,7 @@ def get_last_calc_id(datadir=None):
     Extract the latest calculation ID from the given directory.
     If none is found, return 0.
     """
-    datadir = datadir or get_datadir()
-    calcs = get_calc_ids(datadir)
-    if not calcs:
-        return 0
-    return calcs[-1]
+    return max(_calc_ids(datadir or get_datadir()), default=0)
 
 
 def _update_log_record(self, record):
@@ -260,7 +259,7 @@ class LogContext:
             dbcmd('finish', self.calc_id, 'complete')
         for handler in self.handlers:
             logging.root.removeHandler(handler)
-        parallel.Starmap.shutdown()
+        parallel.Starmap.shutdown()  # end of the job
 
     def __getstate__(self):
         # ensure pickleability
@@ -96,6 +96,23 @@ def build_eid_sid_rlz(allrlzs, sids, eids, rlzs):
     return eid_sid_rlz
 
 
+class _SiteColumns(object):
+    """
+    Wrapper over a context array returning contiguous copies of its
+    columns, extracted only once and then cached as attributes
+    """
+    def __init__(self, ctx):
+        self._ctx = ctx
+
+    def __getattr__(self, name):
+        try:
+            col = numpy.ascontiguousarray(self._ctx[name])
+        except ValueError:  # no field of that name
+            raise AttributeError(name)
+        setattr(self, name, col)
+        return col
+
+
 class GmfComputer(object):
     """
     Given an earthquake rupture, the GmfComputer computes
@@ -213,16 +230,20 @@ class GmfComputer(object):
         data['gmv'].append(array)
 
         if self.sec_perils:
+            # avoid importing openquake.sep from hazardlib
+            compute_all = self.sec_perils[0].compute_all
+            # the same site columns are used for all events and perils
+            sites = _SiteColumns(self.ctx)
             n = 0
             for rlz in rlzs:
                 eids = self.eid[self.rlz == rlz]
                 E = len(eids)
                 for e, eid in enumerate(eids):
                     gmfa = array[:, :, n + e].T  # shape (M, N)
-                    for sp in self.sec_perils:
-                        o = sp.compute(mag, zip(self.imts, gmfa), self.ctx)
-                        for outkey, outarr in zip(sp.outputs, o):
-                            data[outkey].append(outarr)
+                    for outkey, outarr in compute_all(
+                            self.sec_perils, mag, zip(self.imts, gmfa),
+                            sites):
+                        data[outkey].append(outarr)
                 n += E
 
     def strip_zeros(self, data):
@@ -61,37 +61,33 @@ class BakerJayaram2008(CrossCorrelation):
     on Earthquake Spectra. This model works for GMRotI50.
     """
     def get_correlation(self, from_imt: IMT, to_imt: IMT) -> float:
+        return self._pairwise([from_imt.period, to_imt.period])[0, 1]
 
-        from_per = from_imt.period
-        to_per = to_imt.period
-
-        if np.abs(from_per-to_per) < 1e-10:
-            return 1.0
-
-        t_min = np.min([from_per, to_per])
-        t_max = np.max([from_per, to_per])
+    def get_cross_correlation_mtx(self, imts: list) -> np.ndarray:
+        return self._pairwise([imt.period for imt in imts])
 
-        c1 = 1 - np.cos(constants.pi/2 -
-                        0.366 * np.log(t_max/np.max([t_min, 0.109])))
-        c2 = 0.0
-        if t_max < 0.2:
+    @staticmethod
+    def _pairwise(periods):
+        """
+        :param periods: a sequence of N periods
+        :returns: an array of shape (N, N) with the correlation coefficients
+        """
+        T = np.array(periods, float)
+        t_min = np.minimum.outer(T, T)
+        t_max = np.maximum.outer(T, T)
+        with np.errstate(all='ignore'):
+            c1 = 1 - np.cos(constants.pi/2 -
+                            0.366 * np.log(t_max/np.maximum(t_min, 0.109)))
             term1 = 1.0 - 1.0/(1.0+np.exp(100.0*t_max-5.0))
             term2 = (t_max-t_min) / (t_max-0.0099)
-            c2 = 1 - 0.105 * term1 * term2
-        c3 = c1
-        if t_max < 0.109:
-            c3 = c2
-        c4 = c1 + 0.5 * (np.sqrt(c3) - c3) * (
-            1 + np.cos(constants.pi*t_min/0.109))
-        if t_max < 0.109:
-            corr = c2
-        elif t_min > 0.109:
-            corr = c1
-        elif t_max < 0.2:
-            corr = np.amin([c2, c4])
-        else:
-            corr = c4
-        return corr  # a scalar
+            c2 = np.where(t_max < 0.2, 1 - 0.105 * term1 * term2, 0.)
+            c3 = np.where(t_max < 0.109, c2, c1)
+            c4 = c1 + 0.5 * (np.sqrt(c3) - c3) * (
+                1 + np.cos(constants.pi*t_min/0.109))
+        corr = np.select([t_max < 0.109, t_min > 0.109, t_max < 0.2],
+                         [c2, c1, np.minimum(c2, c4)], c4)
+        corr[np.abs(T[:, None] - T) < 1e-10] = 1.0
+        return corr
 
 
 # ######################## CrossCorrelationBetween ########################## #
@@ -132,23 +128,26 @@ class GodaAtkinson2009(CrossCorrelationBetween):
         """
         if from_imt == to_imt:
             return 1.0
+        return self._pairwise([from_imt.period, to_imt.period])[0, 1]
 
-        T1 = from_imt.period or 0.05  # for PGA
-        T2 = to_imt.period or 0.05  # for PGA
-
-        Tmin = min(T1, T2)
-        Tmax = max(T1, T2)
-        ITmin = 1.0 if Tmin < 0.25 else 0.0
-
+    @staticmethod
+    def _pairwise(periods):
+        """
+        :param periods: a sequence of N periods (0 for PGA)
+        :returns: an array of shape (N, N) with the correlation coefficients
+        """
+        T = np.array([period or 0.05 for period in periods])  # 0.05 for PGA
+        Tmin = np.minimum.outer(T, T)
+        Tmax = np.maximum.outer(T, T)
+        ITmin = np.where(Tmin < 0.25, 1.0, 0.0)
         theta1 = 1.374
         theta2 = 5.586
         theta3 = 0.728
-
-        angle = np.pi/2.0 - (theta1 + theta2 * ITmin * (Tmin / Tmax) ** theta3 *
-                            np.log10(Tmin / 0.25)) * np.log10(Tmax / Tmin)
+        angle = np.pi/2.0 - (
+            theta1 + theta2 * ITmin * (Tmin / Tmax) ** theta3 *
+            np.log10(Tmin / 0.25)) * np.log10(Tmax / Tmin)
         delta = 1.0 + np.cos(-1.5 * np.log10(Tmax / Tmin))
-        corr = (1.0 - np.cos(angle) + delta) / 3.0
-        return min(corr, 1.0)
+        return np.minimum((1.0 - np.cos(angle) + delta) / 3.0, 1.0)
 
     def get_inter_eps(self, imts, num_events, rng):
         """
@@ -169,10 +168,11 @@ class GodaAtkinson2009(CrossCorrelationBetween):
         try:
             return self.cache[periods]
         except KeyError:
-            self.cache[periods] = corma = np.zeros((len(imts), len(imts)))
-        for i, imi in enumerate(imts):
-            for j, imj in enumerate(imts):
-                corma[i, j] = self.get_correlation(imi, imj)
+            pass
+        corma = self._pairwise(periods)
+        names = np.array([imt.string for imt in imts])
+        corma[names[:, None] == names] = 1.0
+        self.cache[periods] = corma
         return corma
 
 
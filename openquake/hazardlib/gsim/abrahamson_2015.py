@@ -26,8 +26,10 @@ Module exports :class:`AbrahamsonEtAl2015`
                :class:`AbrahamsonEtAl2015SSlabLow`
 
 """
+import math
 import numpy as np
 
+from openquake.baselib.performance import jittable
 from openquake.hazardlib.gsim.base import GMPE, CoeffsTable
 from openquake.hazardlib import const
 from openquake.hazardlib.imt import PGA, SA
@@ -43,6 +45,10 @@ CONSTS = {
     'c4': 10.0,
     'C1': 7.8
 }
+# the same constants as module-level floats, to avoid dict lookups
+_N, _C, _THETA3, _THETA4, _THETA5, _THETA9, _C4, _C1 = (
+    CONSTS['n'], CONSTS['c'], CONSTS['theta3'], CONSTS['theta4'],
+    CONSTS['theta5'], CONSTS['theta9'], CONSTS['c4'], CONSTS['C1'])
 
 C1 = 7.2  # for Montalva2017
 
@@ -93,8 +99,8 @@ def _compute_magterm(C1, theta1, theta4, theta5, theta13, dc1, mag):
     """
     base = theta1 + theta4 * dc1
     dmag = C1 + dc1
-    f_mag = np.where(
-        mag > dmag, theta5 * (mag - dmag), theta4 * (mag - dmag))
+    # branchless choice of the slope, mag can be a scalar or an array
+    f_mag = np.where(mag > dmag, theta5, theta4) * (mag - dmag)
     return base + f_mag + theta13 * (10. - mag) ** 2.
 
 
@@ -108,12 +114,40 @@ def _compute_disterm(trt, C1, theta2, theta14, theta3, ctx, c4, theta9,
         dists = ctx.rhypo
     else:
         raise NotImplementedError(trt)
-    return (theta2 + theta14 + theta3 * (ctx.mag - C1)) * np.log(
-        dists + c4 * np.exp((ctx.mag - 6.) * theta9)) + (
+    return _disterm(dists, ctx.mag, C1, theta2, theta14, theta3, c4, theta9,
+                    theta6_adj, theta6, theta10)
+
+
+@jittable
+def _disterm(dists, mag, C1, theta2, theta14, theta3, c4, theta9,
+             theta6_adj, theta6, theta10):
+    # with numba the array expression is fused in a single loop
+    return (theta2 + theta14 + theta3 * (mag - C1)) * np.log(
+        dists + c4 * np.exp((mag - 6.) * theta9)) + (
         theta6_adj + theta6) * dists + theta10
 
 
-def _compute_forearc_backarc_term(trt, faba_model, C, ctx):
+@jittable
+def _mean_terms(mag, dists, z_h, cf):
+    # sum of the magnitude, distance and focal depth terms; with numba
+    # the site arrays are traversed without intermediate arrays
+    C1m, theta1, theta4, theta5, theta13, dc1 = cf[:6]
+    C1d, theta2, theta14, theta3, c4, theta9, theta6, theta10 = cf[6:14]
+    theta6_adj, theta11 = cf[14:]
+    dmag = C1m + dc1
+    return ((theta1 + theta4 * dc1) +
+            np.where(mag > dmag, theta5, theta4) * (mag - dmag) +
+            theta13 * (10. - mag) ** 2. +
+            (theta2 + theta14 + theta3 * (mag - C1d)) * np.log(
+                dists + c4 * np.exp((mag - 6.) * theta9)) +
+            (theta6_adj + theta6) * dists + theta10 +
+            theta11 * (np.minimum(z_h, 120.) - 60.))
+
+
+def _compute_forearc_backarc_term(trt, faba_model, C, ctx, backarc=None):
+    """
+    :param backarc: indices of the backarc sites, computed if not given
+    """
     if trt == const.TRT.SUBDUCTION_INTERFACE:
         dists = ctx.rrup
         a, b = C['theta15'], C['theta16']
@@ -125,18 +159,18 @@ def _compute_forearc_backarc_term(trt, faba_model, C, ctx):
     else:
         raise NotImplementedError(trt)
     if faba_model is None:
-        backarc = np.bool_(ctx.backarc)
+        if backarc is None:
+            backarc = np.flatnonzero(ctx.backarc)
+        if len(backarc) == 0:  # only forearc sites, F_FABA = 0.
+            return np.broadcast_to(0., dists.shape)
         f_faba = np.zeros_like(dists)
         # Term only applies to backarc ctx (F_FABA = 0. for forearc)
-        fixed_dists = dists[backarc]
-        fixed_dists[fixed_dists < min_dist] = min_dist
+        fixed_dists = np.maximum(dists[backarc], min_dist)
         f_faba[backarc] = a + b * np.log(fixed_dists / 40.)
         return f_faba
 
     # in BCHydro subclasses
-    fixed_dists = np.copy(dists)
-    fixed_dists[fixed_dists < min_dist] = min_dist
-    f_faba = a + b * np.log(fixed_dists / 40.)
+    f_faba = a + b * np.log(np.maximum(dists, min_dist) / 40.)
     return f_faba * faba_model(-ctx.xvf)
 
 
@@ -147,19 +181,19 @@ def _compute_distance_term(kind, trt, theta6_adj, C, ctx):
     if kind.startswith("montalva"):
         theta3 = C['theta3']
     else:
-        theta3 = CONSTS['theta3']
+        theta3 = _THETA3
     if kind == "montalva17":
         C1 = 7.2
     else:
         C1 = 7.8
     if trt == const.TRT.SUBDUCTION_INTERFACE:
         return _compute_disterm(
-            trt, C1, C['theta2'], 0., theta3, ctx, CONSTS['c4'],
-            CONSTS['theta9'], theta6_adj, C['theta6'], theta10=0.)
+            trt, C1, C['theta2'], 0., theta3, ctx, _C4, _THETA9,
+            theta6_adj, C['theta6'], theta10=0.)
     else:  # sslab
         return _compute_disterm(
             trt, C1, C['theta2'], C['theta14'], theta3, ctx,
-            CONSTS['c4'], CONSTS['theta9'], theta6_adj, C['theta6'],
+            _C4, _THETA9, theta6_adj, C['theta6'],
             C["theta10"])
 
 
@@ -183,30 +217,81 @@ def _compute_magnitude_term(kind, C, dc1, mag):
     """
     if kind == "base":
         return _compute_magterm(
-            CONSTS['C1'], C['theta1'], CONSTS['theta4'],
-            CONSTS['theta5'], C['theta13'], dc1, mag)
+            _C1, C['theta1'], _THETA4, _THETA5, C['theta13'], dc1, mag)
     elif kind == "montalva16":
         return _compute_magterm(
-            CONSTS['C1'], C['theta1'], C['theta4'],
+            _C1, C['theta1'], C['theta4'],
             C['theta5'], C['theta13'], dc1, mag)
     elif kind == "montalva17":
         return _compute_magterm(C1, C['theta1'], C['theta4'],
                                 C['theta5'], 0., dc1, mag)
 
 
-def _compute_pga_rock(kind, trt, theta6_adj, faba_model, C, dc1, ctx):
+def _pack_coeffs(kind, trt, theta6_adj, C, dc1):
+    """
+    Packs the coefficients of the magnitude, distance and focal depth terms
+    in a 1D array; the dispatch on the kind and on the tectonic region
+    type happens here, so the packed array can be cached per IMT
+    """
+    if kind == "base":
+        magc = [_C1, C['theta1'], _THETA4, _THETA5, C['theta13']]
+    elif kind == "montalva16":
+        magc = [_C1, C['theta1'], C['theta4'],
+                C['theta5'], C['theta13']]
+    elif kind == "montalva17":
+        magc = [C1, C['theta1'], C['theta4'], C['theta5'], 0.]
+    theta3 = C['theta3'] if kind.startswith("montalva") else _THETA3
+    C1d = 7.2 if kind == "montalva17" else 7.8
+    if trt == const.TRT.SUBDUCTION_INTERFACE:
+        # no depth scaling for interface events
+        theta14, theta10, theta11 = 0., 0., 0.
+    elif trt == const.TRT.SUBDUCTION_INTRASLAB:
+        theta14, theta10, theta11 = C['theta14'], C['theta10'], C['theta11']
+    else:
+        raise NotImplementedError(trt)
+    return np.array(magc + [dc1, C1d, C['theta2'], theta14, theta3,
+                            _C4, _THETA9, C['theta6'],
+                            theta10, theta6_adj, theta11])
+
+
+def _compute_mean_terms(kind, trt, theta6_adj, C, dc1, ctx, cf=None):
+    """
+    Computes the sum of the magnitude, distance and focal depth terms
+    in a single kernel
+    """
+    if cf is None:
+        cf = _pack_coeffs(kind, trt, theta6_adj, C, dc1)
+    if trt == const.TRT.SUBDUCTION_INTERFACE:
+        return _mean_terms(ctx.mag, ctx.rrup, 60., cf)
+    return _mean_terms(ctx.mag, ctx.rhypo, ctx.hypo_depth, cf)
+
+
+def _compute_pga_rock(kind, trt, theta6_adj, faba_model, C, dc1, ctx,
+                      cf=None, backarc=None):
     """
     Compute and return mean imt value for rock conditions
     (vs30 = 1000 m/s)
     """
-    mean = (_compute_magnitude_term(kind, C, dc1, ctx.mag) +
-            _compute_distance_term(kind, trt, theta6_adj, C, ctx) +
-            _compute_focal_depth_term(trt, C, ctx) +
-            _compute_forearc_backarc_term(trt, faba_model, C, ctx))
-    # Apply linear site term
-    site_response = ((C['theta12'] + C['b'] * CONSTS['n']) *
-                     np.log(1000. / C['vlin']))
-    return mean + site_response
+    mean = _compute_mean_terms(kind, trt, theta6_adj, C, dc1, ctx, cf)
+    mean += _compute_forearc_backarc_term(trt, faba_model, C, ctx, backarc)
+    # Apply linear site term; the log is on a scalar coefficient
+    mean += ((C['theta12'] + C['b'] * _N) *
+             math.log(1000. / C['vlin']))
+    return mean
+
+
+def _get_coeffs(gsim, imt):
+    """
+    :returns: C, dc1 and the packed coefficients, cached per IMT
+    """
+    try:
+        return gsim._packed[imt]
+    except KeyError:
+        C = gsim.COEFFS[imt]
+        dc1 = gsim.delta_c1 or gsim.COEFFS_MAG_SCALE[imt]["dc1"]
+        gsim._packed[imt] = C, dc1, _pack_coeffs(
+            gsim.kind, gsim.trt, gsim.theta6_adj, C, dc1)
+        return gsim._packed[imt]
 
 
 def _compute_site_response_term(C, ctx, pga1000):
@@ -214,22 +299,23 @@ def _compute_site_response_term(C, ctx, pga1000):
     Compute and return site response model term
     This GMPE adopts the same site response scaling model of
     Walling et al (2008) as implemented in the Abrahamson & Silva (2008)
-    GMPE. The functional form is retained here.
-    """
-    vs_star = ctx.vs30.copy()
-    vs_star[vs_star > 1000.0] = 1000.
-    arg = vs_star / C["vlin"]
-    site_resp_term = C["theta12"] * np.log(arg)
-    # Get linear scaling term
-    idx = ctx.vs30 >= C["vlin"]
-    site_resp_term[idx] += (C["b"] * CONSTS["n"] * np.log(arg[idx]))
-    # Get nonlinear scaling term
-    idx = np.logical_not(idx)
-    site_resp_term[idx] += (
-        -C["b"] * np.log(pga1000[idx] + CONSTS["c"]) +
-        C["b"] * np.log(pga1000[idx] + CONSTS["c"] *
-                        (arg[idx] ** CONSTS["n"])))
-    return site_resp_term
+    GMPE. The functional form is retained here. The context is not
+    modified, so vs30 is never copied.
+    """
+    return _site_term(ctx.vs30, pga1000, C["vlin"], C["theta12"], C["b"])
+
+
+@jittable
+def _site_term(vs30, pga1000, vlin, theta12, b):
+    vs_star = np.minimum(vs30, 1000.)
+    arg = vs_star / vlin
+    log_arg = np.log(arg)
+    # linear scaling term for vs30 >= vlin, otherwise nonlinear scaling
+    # term log((pga + c*arg^n) / (pga + c)) computed with log1p, which is
+    # accurate when the ratio is close to 1
+    return theta12 * log_arg + np.where(
+        vs30 >= vlin, b * _N * log_arg,
+        b * np.log1p(_C * (arg ** _N - 1.) / (pga1000 + _C)))
 
 
 class AbrahamsonEtAl2015SInter(GMPE):
@@ -294,6 +380,7 @@ class AbrahamsonEtAl2015SInter(GMPE):
             self.faba_model = self.FABA_ALL_MODELS[faba_type](**kwargs)
         else:
             self.faba_model = None
+        self._packed = {}  # imt -> packed coefficients
 
     def compute(self, ctx: np.recarray, imts, mean, sig, tau, phi):
         """
@@ -301,27 +388,22 @@ class AbrahamsonEtAl2015SInter(GMPE):
         <.base.GroundShakingIntensityModel.compute>`
         for spec of input and result values.
         """
-        C_PGA = self.COEFFS[PGA()]
-        dc1_pga = self.delta_c1 or self.COEFFS_MAG_SCALE[PGA()]["dc1"]
+        C_PGA, dc1_pga, cf_pga = _get_coeffs(self, PGA())
+        # the backarc sites are the same for all IMTs
+        backarc = (np.flatnonzero(ctx.backarc) if self.faba_model is None
+                   else None)
         # compute median pga on rock (vs30=1000), needed for site response
         # term calculation
         pga1000 = np.exp(_compute_pga_rock(
             self.kind, self.trt, self.theta6_adj, self.faba_model,
-            C_PGA, dc1_pga, ctx))
+            C_PGA, dc1_pga, ctx, cf_pga, backarc))
         for m, imt in enumerate(imts):
-            C = self.COEFFS[imt]
-            dc1 = self.delta_c1 or self.COEFFS_MAG_SCALE[imt]["dc1"]
-            mean[m] = (
-                _compute_magnitude_term(
-                    self.kind, C, dc1, ctx.mag) +
-                _compute_distance_term(
-                    self.kind, self.trt, self.theta6_adj, C, ctx) +
-                _compute_focal_depth_term(
-                    self.trt, C, ctx) +
-                _compute_forearc_backarc_term(
-                    self.trt, self.faba_model, C, ctx) +
-                _compute_site_response_term(
-                    C, ctx, pga1000))
+            C, dc1, cf = _get_coeffs(self, imt)
+            mean[m] = _compute_mean_terms(
+                self.kind, self.trt, self.theta6_adj, C, dc1, ctx, cf)
+            mean[m] += _compute_forearc_backarc_term(
+                self.trt, self.faba_model, C, ctx, backarc)
+            mean[m] += _compute_site_response_term(C, ctx, pga1000)
             if self.sigma_mu_epsilon:
                 sigma_mu = get_stress_factor(
                     imt, self.DEFINED_FOR_TECTONIC_REGION_TYPE ==
@@ -119,8 +119,7 @@ def compute_site_term(C, vs30, pga1000):
     """
     Returns the site amplification
     """
-    vsstar = np.copy(vs30)
-    vsstar[vs30 >= 1000.0] = 1000.0
+    vsstar = np.minimum(vs30, 1000.0)
     f_site = np.zeros_like(vs30)
     # Consider the cases of only linear amplification
     idx = vs30 >= C["vlin"]
@@ -131,10 +130,10 @@ def compute_site_term(C, vs30, pga1000):
     if np.any(idx):
         # Linear term
         flin = C["a12"] * np.log(vsstar[idx] / C["vlin"])
-        # Nonlinear term
-        fnl = (-C["b"] * np.log(pga1000[idx] + CONSTANTS["c"])) +\
-            (C["b"] * np.log(pga1000[idx] + CONSTANTS["c"] *
-             ((vsstar[idx] / C["vlin"]) ** CONSTANTS["n"])))
+        # Nonlinear term, the difference of two logs as a single log1p
+        fnl = C["b"] * np.log1p(
+            CONSTANTS["c"] * ((vsstar[idx] / C["vlin"]) ** CONSTANTS["n"] - 1.)
+            / (pga1000[idx] + CONSTANTS["c"]))
         f_site[idx] = flin + fnl
     return f_site
 
@@ -259,12 +258,12 @@ class AbrahamsonEtAl2018SInter(GMPE):
         """
         C_PGA = self.COEFFS[PGA()]
         slab = self.CASCADIA_ADJUSTMENT == "adj_slab"
+        # compute median pga on rock (vs30=1000), needed for site response
+        # term calculation; it does not depend on the IMT
+        pga1000 = np.exp(_compute_pga_rock(slab, C_PGA, ctx) +
+                         C_PGA[self.CASCADIA_ADJUSTMENT])
         for m, imt in enumerate(imts):
             C = self.COEFFS[imt]
-            # compute median pga on rock (vs30=1000), needed for site response
-            # term calculation
-            pga1000 = np.exp(_compute_pga_rock(slab, C_PGA, ctx) +
-                             C_PGA[self.CASCADIA_ADJUSTMENT])
             # Get full model
             mean[m] = (compute_base_term(slab, C) +
                        compute_magnitude_term(slab, C, ctx.mag) +
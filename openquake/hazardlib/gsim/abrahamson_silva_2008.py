@@ -326,8 +326,7 @@ def _compute_vs30_star_factor(imt, vs30):
     Compute and return vs30 star factor, equation 5, page 77.
     """
     v1 = _compute_v1_factor(imt)
-    vs30_star = vs30.copy()
-    vs30_star[vs30_star >= v1] = v1
+    vs30_star = np.minimum(vs30, v1)
 
     return vs30_star, v1
 
@@ -136,8 +136,7 @@ def _get_nonlinear_site_term(C, vs30, pga_rock):
     """
     Returns the nonlinear site scaling term (equation 7)
     """
-    v_s = np.copy(vs30)
-    v_s[vs30 > 760.] = 760.
+    v_s = np.minimum(vs30, 760.)
     # Nonlinear controlling parameter (equation 8)
     f_2 = C["f4"] * (np.exp(C["f5"] * (v_s - 360.)) - np.exp(C["f5"] * 400.))
     fnl = CONSTS["f1"] + f_2 * np.log((pga_rock + CONSTS["f3"]) / CONSTS["f3"])
@@ -166,7 +166,8 @@ def site_amplification(ctx, imt, pga1100):
                             [0, AB06_2000div1100])
 
         # BSSA14 factor relative to 1100
-        BSSA14 = BooreEtAl2014()
+        # the coefficients are a class attribute, no instance is needed
+        BSSA14 = BooreEtAl2014
         C = BSSA14.COEFFS[imt]
         BSSA14_vs = (_get_linear_site_term(C, vs30_gte1100)
                      - _get_linear_site_term(C, np.array([1100.])))
@@ -128,8 +128,7 @@ def _compute_vs30_star_factor(imt, vs30):
     Compute and return vs30 star factor, Equation 4, page 1028.
     """
     v1 = _compute_v1_factor(imt)
-    vs30_star = vs30.copy()
-    vs30_star[vs30_star >= v1] = v1
+    vs30_star = np.minimum(vs30, v1)
 
     return vs30_star, v1
 
@@ -130,12 +130,12 @@ def get_distance_coefficients_2(kind, c3, c3_epsilon, C, imt, sctx):
         return c3[imt]["c3"] * np.ones(sctx.region.shape)
 
     # Default c3 and tau values to the original GMPE c3 and tau
-    c3_ = C["c3"] + np.zeros(sctx.region.shape)
-    tau_c3 = C["tau_c3"] + np.zeros(sctx.region.shape)
+    c3_ = np.full(sctx.region.shape, C["c3"])
+    tau_c3 = np.full(sctx.region.shape, C["tau_c3"])
     if not np.any(sctx.region) or ("PGV" in str(imt)):
         # No regionalisation - take the default C3 and multiply tau_c3
         # by the original epsilon
-        return (c3_ + c3_epsilon * tau_c3) + np.zeros(sctx.region.shape)
+        return c3_ + c3_epsilon * tau_c3
     # Some ctx belong to the calibrated regions - loop through them
     C3_R = C3_REGIONS[imt]
     for i in range(1, 6):
@@ -256,8 +256,7 @@ def get_site_amplification(kind, extra, C, ctx, imt):
         ampl = (C["g0_slope"] + C["g1_slope"] * sref +
                 C["g2_slope"] * (sref ** 2.))
     elif kind == "ESHM20":
-        vs30 = np.copy(ctx.vs30)
-        vs30[vs30 > 1100.] = 1100.
+        vs30 = np.minimum(ctx.vs30, 1100.)
         ampl = np.zeros(vs30.shape)
         # For observed vs30 ctx
         ampl[ctx.vs30measured] = (C["d0_obs"] + C["d1_obs"] *
@@ -92,9 +92,10 @@ class CY14SiteTerm(GMPE):
         <.base.GroundShakingIntensityModel.compute>`
         for spec of input and result values.
         """
-        # Prepare sites
+        # Prepare sites; the copy is needed since the ctx can be readonly,
+        # but the reference vs30 is assigned in place, without a new array
         rup_rock = copy.copy(ctx)
-        rup_rock.vs30 = np.full_like(ctx.vs30, 1130.)
+        rup_rock['vs30'] = 1130.
 
         # Compute mean and standard deviation using the original GMM. These
         # values are used as ground-motion values on reference rock conditions.
@@ -102,7 +103,7 @@ class CY14SiteTerm(GMPE):
         # the CY14 model
         self.gmpe.compute(rup_rock, imts, mean, sig, tau, phi)
         # Compute the site term correction factor for each IMT
-        vs30 = ctx.vs30.copy()
+        vs30 = ctx.vs30  # not modified by _get_site_term
         for m, imt in enumerate(imts):
             C = ChiouYoungs2014.COEFFS[imt]
             mean[m] += _get_site_term(C, vs30, mean[m])
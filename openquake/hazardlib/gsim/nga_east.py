@@ -414,7 +414,7 @@ def get_linear_stddev(C_LIN, vs30, CONSTANTS):
     Returns the standard deviation of the linear amplification function,
     as defined in equation 4 of Stewart et al., (2019)
     """
-    sigma_v = C_LIN["sigma_vc"] + np.zeros(vs30.shape)
+    sigma_v = np.full(vs30.shape, C_LIN["sigma_vc"])
     idx = vs30 < C_LIN["vf"]
     if np.any(idx):
         dsig = C_LIN["sigma_L"] - C_LIN["sigma_vc"]
@@ -437,8 +437,7 @@ def get_site_amplification(C, psarock, ctx, ck):
     """
     Returns the site amplification model define in equation (9)
     """
-    vs30_s = np.copy(ctx.vs30)
-    vs30_s[vs30_s > 1000.] = 1000.
+    vs30_s = np.minimum(ctx.vs30, 1000.)
     fn_lin = (C["b1"] + ck) * np.log(vs30_s / 760.)
     fn_z = C["b2"] * np.log(ctx.z1pt0)
     fn_nl = C["b3"] * np.log((psarock + 0.1 * g) / (0.1 * g)) *\
@@ -450,16 +449,12 @@ def get_stddevs(phi_0, C, tau, phi, psa_rock, vs30, imt):
     """
     Returns the standard deviation adjusted for the site-response model
     """
-    ysig = np.copy(psa_rock)
-    ysig[ysig > 0.35] = 0.35
-    ysig[ysig < 0.005] = 0.005
-    vsig = np.copy(vs30)
-    vsig[vsig > 600.0] = 600.0
-    vsig[vsig < 150.] = 150.
+    ysig = np.clip(psa_rock, 0.005, 0.35)
+    vsig = np.clip(vs30, 150., 600.)
     sigma_s = C["sigma_s"] * C["c0"] * (
         C["c1"] * np.log(ysig) + C["c2"] * np.log(vsig))
     if phi_0:
-        phi0 = phi_0[imt]['value'] + np.zeros(vs30.shape)
+        phi0 = np.full(vs30.shape, phi_0[imt]['value'])
     else:
         # In the case that no input phi0 is defined take 'approximate'
         # phi0 as 85 % of phi
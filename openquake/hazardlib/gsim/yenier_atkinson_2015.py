@@ -246,8 +246,7 @@ def get_fs_SeyhanStewart2014(C, imt, pga_rock, vs30):
     flin[vs30 > C['Vc']] = C['Vc'] / CONSTS['Vref']
     fl = C['c'] * np.log(flin)
     # Non-linear term
-    v_s = np.copy(vs30)
-    v_s[vs30 > 760.] = 760.
+    v_s = np.minimum(vs30, 760.)
     # parameter (equation 8 of BSSA 2014)
     f_2 = C['f4'] * (np.exp(C['f5'] * (v_s - 360.)) -
                      np.exp(C['f5'] * 400.))
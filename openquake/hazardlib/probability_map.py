@@ -159,6 +159,40 @@ class ProbabilityCurve(object):
 EPSILON = 1E-30
 
 
+if numba:
+    @compile("float64[:, :](float64[:, :], float64[:], float64[:])")
+    def interp_hmaps(log_curves, imls, log_poes):
+        N, P = len(log_curves), len(log_poes)
+        out = numpy.empty((N, P))
+        for n in range(N):
+            out[n] = numpy.interp(log_poes, log_curves[n], imls)
+        return out
+else:
+    def interp_hmaps(log_curves, imls, log_poes):
+        # performed on all the curves at once, as numpy.interp would do
+        N, L = log_curves.shape
+        out = numpy.empty((N, len(log_poes)))
+        rows = numpy.arange(N)
+        for p, log_poe in enumerate(log_poes):
+            j = (log_curves <= log_poe).sum(axis=1) - 1  # xp[j] <= x < xp[j+1]
+            j0 = numpy.clip(j, 0, L - 1)
+            j1 = numpy.clip(j + 1, 0, L - 1)
+            x0, x1 = log_curves[rows, j0], log_curves[rows, j1]
+            y0, y1 = imls[j0], imls[j1]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                slope = (y1 - y0) / (x1 - x0)
+                iml = slope * (log_poe - x0) + y0
+                nan = numpy.isnan(iml)
+                iml[nan] = (slope * (log_poe - x1) + y1)[nan]
+            nan = numpy.isnan(iml) & (y0 == y1)
+            iml[nan] = y0[nan]
+            iml[log_poe == x0] = y0[log_poe == x0]
+            iml[j < 0] = imls[0]
+            iml[j >= L - 1] = imls[-1]
+            out[:, p] = iml
+        return out
+
+
 def compute_hazard_maps(curves, imls, poes):
     """
     Given a set of hazard curve poes, interpolate hazard maps at the specified
@@ -179,33 +213,29 @@ def compute_hazard_maps(curves, imls, poes):
         An array of shape N x P, where N is the number of curves and P the
         number of poes.
     """
-    P = len(poes)
     N, L = curves.shape  # number of levels
     if L != len(imls):
         raise ValueError('The curves have %d levels, %d were passed' %
                          (L, len(imls)))
 
-    log_poes = numpy.log(poes)
-    hmap = numpy.zeros((N, P))
+    log_poes = numpy.log(numpy.array(poes, F64))
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         # avoid RuntimeWarning: divide by zero for zero levels
-        imls = numpy.log(numpy.array(imls[::-1]))
-    for n, curve in enumerate(curves):
-        # the hazard curve, having replaced the too small poes with EPSILON
-        log_curve = numpy.log([max(poe, EPSILON) for poe in curve[::-1]])
-        for p, log_poe in enumerate(log_poes):
-            if log_poe > log_curve[-1]:
-                # special case when the interpolation poe is bigger than the
-                # maximum, i.e the iml must be smaller than the minimum;
-                # extrapolate the iml to zero as per
-                # https://bugs.launchpad.net/oq-engine/+bug/1292093;
-                # then the hmap goes automatically to zero
-                pass
-            else:
-                # exp-log interpolation, to reduce numerical errors
-                # see https://bugs.launchpad.net/oq-engine/+bug/1252770
-                hmap[n, p] = numpy.exp(numpy.interp(log_poe, log_curve, imls))
+        imls = numpy.log(numpy.array(imls[::-1], F64))
+    # the hazard curves, having replaced the too small poes with EPSILON
+    log_curves = numpy.log(numpy.maximum(curves[:, ::-1], EPSILON), dtype=F64)
+    # exp-log interpolation, to reduce numerical errors, see
+    # https://bugs.launchpad.net/oq-engine/+bug/1252770
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        hmap = numpy.exp(interp_hmaps(log_curves, imls, log_poes))
+    # special case when the interpolation poe is bigger than the
+    # maximum, i.e the iml must be smaller than the minimum;
+    # extrapolate the iml to zero as per
+    # https://bugs.launchpad.net/oq-engine/+bug/1292093;
+    # then the hmap goes automatically to zero
+    hmap[log_poes > log_curves[:, -1:]] = 0
     return hmap
 
 
@@ -199,6 +199,7 @@ site_param_dt = {
     'crit_accel': numpy.float64,
     'unit': (numpy.string_, 5),
     'liq_susc_cat': (numpy.string_, 2),
+    'liq_susc_idx': numpy.int8,
     'dw': numpy.float64,
     'yield_acceleration': numpy.float64,
     'slope': numpy.float64,
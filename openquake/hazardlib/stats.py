@@ -174,6 +174,21 @@ def std_curve(values, weights=None):
 
 # NB: for equal weights and sorted values the quantile is computed as
 # numpy.interp(q, [1/N, 2/N, ..., N/N], values)
+def _quantile_equal(quantile, curves):
+    # with equal weights the CDF is (i + 1) / R and the position of the
+    # quantile is known in advance: a partial sort is enough
+    R = len(curves)
+    pos = quantile * R - 1
+    if pos <= 0:
+        return numpy.asarray(curves.min(axis=0), numpy.float64)
+    elif pos >= R - 1:
+        return numpy.asarray(curves.max(axis=0), numpy.float64)
+    k = int(pos)
+    data = numpy.partition(curves, [k, k + 1], axis=0).astype(
+        numpy.float64, copy=False)
+    return numpy.asarray(data[k] + (pos - k) * (data[k + 1] - data[k]))
+
+
 def quantile_curve(quantile, curves, weights=None):
     """
     Compute the weighted quantile aggregate of an array or list of arrays
@@ -196,19 +211,28 @@ def quantile_curve(quantile, curves, weights=None):
     if not isinstance(curves, numpy.ndarray):
         curves = numpy.array(curves)
     R = len(curves)
-    if weights is None:
-        weights = numpy.ones(R) / R
-    else:
+    if weights is not None:
         weights = numpy.array(weights)
         assert len(weights) == R, (len(weights), R)
-    result = numpy.zeros(curves.shape[1:])
-    for idx, _ in numpy.ndenumerate(result):
-        data = curves[(slice(None), ) + idx]
-        sorted_idxs = numpy.argsort(data)
-        cum_weights = numpy.cumsum(weights[sorted_idxs])
-        # get the quantile from the interpolated CDF
-        result[idx] = numpy.interp(quantile, cum_weights, data[sorted_idxs])
-    return result
+    if weights is None or (weights == weights[0]).all():
+        return _quantile_equal(quantile, curves)
+    # sort all the curves at once and get the quantile from the
+    # interpolated CDF, with the same algorithm as numpy.interp
+    sorted_idxs = numpy.argsort(curves, axis=0, kind='stable')
+    data = numpy.take_along_axis(curves, sorted_idxs, axis=0).astype(
+        numpy.float64, copy=False)
+    cum_weights = numpy.cumsum(weights[sorted_idxs], axis=0)
+    j = (cum_weights <= quantile).sum(axis=0) - 1  # cum_weights[j] <= q
+    j0 = numpy.clip(j, 0, R - 1)[None]
+    j1 = numpy.clip(j + 1, 0, R - 1)[None]
+    x0 = numpy.take_along_axis(cum_weights, j0, axis=0)[0]
+    x1 = numpy.take_along_axis(cum_weights, j1, axis=0)[0]
+    y0 = numpy.take_along_axis(data, j0, axis=0)[0]
+    y1 = numpy.take_along_axis(data, j1, axis=0)[0]
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        interp = (y1 - y0) / (x1 - x0) * (quantile - x0) + y0
+    return numpy.where(j < 0, data[0],
+                       numpy.where(j >= R - 1, data[-1], interp))
 
 
 def max_curve(values, weights=None):
@@ -19,9 +19,9 @@
 import unittest
 import numpy
 from numpy.testing import assert_allclose as aac
-from openquake.hazardlib.imt import PGA, SA
+from openquake.hazardlib.imt import PGA, PGV, SA
 from openquake.hazardlib.cross_correlation import (
-    BakerJayaram2008, GodaAtkinson2009,
+    BakerJayaram2008, GodaAtkinson2009, Bradley2012,
     NoCrossCorrelation, FullCrossCorrelation)
 
 
@@ -131,3 +131,20 @@ class CrossCorrelationMatrixTest(unittest.TestCase):
         cm = BakerJayaram2008()
         computed = cm.get_cross_correlation_mtx(imts)
         aac(computed, expected)
+
+    def test_cross_corr_mtx_3x3(self):
+        imts = [SA(0.05), SA(0.15), SA(0.5)]
+        expected = numpy.array([[1.0, 0.9153049738, 0.5925040604],
+                                [0.9153049738, 1.0, 0.5734688765],
+                                [0.5925040604, 0.5734688765, 1.0]])
+        cm = BakerJayaram2008()
+        computed = cm.get_cross_correlation_mtx(imts)
+        aac(computed, expected)
+
+    def test_correlation_matrix_pairwise(self):
+        # the matrices must agree with get_correlation on every pair
+        imts = [PGV(), SA(0.3), SA(1.0), PGA()]
+        for cm in (GodaAtkinson2009(), Bradley2012()):
+            expected = numpy.array([[cm.get_correlation(imi, imj)
+                                     for imj in imts] for imi in imts])
+            aac(cm._get_correlation_matrix(imts), expected)
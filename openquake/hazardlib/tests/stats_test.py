@@ -93,6 +93,16 @@ class QuantileCurveTestCase(unittest.TestCase):
         actual_curve = quantile_curve(quantile, curves)
         numpy.testing.assert_allclose(expected_curve, actual_curve, atol=0.005)
 
+    def test_compute_quantile_curve_equal_weights(self):
+        # with equal weights the partial sort is used
+        curves = numpy.random.default_rng(42).random((7, 10))
+        for quantile in (.05, .15, .5, .84, .95):
+            expected = numpy.quantile(
+                curves, quantile, axis=0, method='interpolated_inverted_cdf')
+            aaae(quantile_curve(quantile, curves), expected)
+            aaae(quantile_curve(quantile, curves, numpy.ones(7) / 7),
+                 expected)
+
     def test_compute_weighted_quantile_curve_case1(self):
         expected_curve = numpy.array([0.69909, 0.60859, 0.50328])
 
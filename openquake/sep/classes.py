@@ -17,18 +17,17 @@
 # along with OpenQuake.  If not, see <http://www.gnu.org/licenses/>.
 import abc
 import inspect
+import numpy
 from openquake.hazardlib import imt
 from openquake.sep.landslide.common import (
     static_factor_of_safety, rock_slope_static_factor_of_safety)
 from openquake.sep.landslide.newmark import (
     newmark_critical_accel,
-    newmark_displ_from_pga_M,
-    prob_failure_given_displacement)
+    newmark_displ_prob)
 from openquake.sep.landslide.rockfalls import (
     critical_accel_rock_slope,
-    newmark_displ_from_pga)
+    newmark_displ)
 from openquake.sep.liquefaction.liquefaction import (
-    hazus_liquefaction_probability,
     zhu_etal_2015_general,
     zhu_etal_2017_coastal,
     zhu_etal_2017_general,
@@ -38,12 +37,31 @@ from openquake.sep.liquefaction.liquefaction import (
     akhlagi_etal_2021_model_b,
     bozzoni_etal_2021_europe,
     todorovic_silva_2022_nonparametric_general,
-    HAZUS_LIQUEFACTION_PGA_THRESHOLD_TABLE)
+    hazus_liquefaction_probability_fn,
+    HAZUS_LIQUEFACTION_PGA_THRESHOLD_TABLE,
+    HAZUS_LIQUEFACTION_COND_PROB_PGA_TABLE,
+    HAZUS_LIQUEFACTION_MAP_AREA_PROPORTION_TABLE)
 from openquake.sep.liquefaction.lateral_spreading import (
-    hazus_lateral_spreading_displacement)
+    hazus_lateral_spreading_displacement_fn, _convert_from_inches)
 from openquake.sep.liquefaction.vertical_settlement import (
     hazus_vertical_settlement)
 
+F32 = numpy.float32
+
+# indices of the liquefaction susceptibility categories in the lookup arrays
+_CAT_TO_IDX = {b'vh': 0, b'h': 1, b'm': 2, b'l': 3, b'vl': 4, b'n': 5}
+_COND_PROB_COEFFS = numpy.array(
+    [HAZUS_LIQUEFACTION_COND_PROB_PGA_TABLE[cat] for cat in _CAT_TO_IDX])
+_MAP_PROPORTION = numpy.array(
+    [HAZUS_LIQUEFACTION_MAP_AREA_PROPORTION_TABLE[cat] for cat in _CAT_TO_IDX])
+
+
+def _add_liq_susc_idx(sites):
+    # add the column liq_susc_idx used to index the lookup arrays
+    if 'liq_susc_idx' not in sites.array.dtype.names:
+        sites.add_col('liq_susc_idx', numpy.int8,
+                      [_CAT_TO_IDX[cat] for cat in sites.liq_susc_cat])
+
 
 class SecondaryPeril(metaclass=abc.ABCMeta):
     """
@@ -61,26 +79,74 @@ class SecondaryPeril(metaclass=abc.ABCMeta):
     The ``compute`` method will return a tuple with ``O`` arrays where ``O``
     is the number of outputs.
     """
+    __slots__ = ()
     outputs = []
 
     @classmethod
     def __init_subclass__(cls):
-        # make sure the name of the outputs are valid IMTs
-        for out in cls.outputs:
-            imt.from_string(out)
+        # make sure the name of the outputs are valid IMTs, unless they
+        # depend on the instance (i.e. `outputs` is a property)
+        if isinstance(cls.outputs, list):
+            for out in cls.outputs:
+                imt.from_string(out)
+        # names of the parameters of __init__, used in .instantiate
+        cls._init_params = tuple(inspect.signature(cls).parameters)
 
     @classmethod
     def instantiate(cls, secondary_perils, sec_peril_params):
         inst = []
         for clsname in secondary_perils:
             c = globals()[clsname]
-            kw = {}
-            for param in inspect.signature(c).parameters:
-                if param in sec_peril_params:
-                    kw[param] = sec_peril_params[param]
+            kw = {param: sec_peril_params[param] for param in c._init_params
+                  if param in sec_peril_params}
             inst.append(c(**kw))
         return inst
 
+    @staticmethod
+    def compute_all(perils, mag, imt_gmf, sites):
+        """
+        :param perils: a list of SecondaryPeril instances
+        :param mag: magnitude
+        :param imt_gmf: an iterable of pairs (imt, gmf)
+        :param sites: a filtered site collection
+        :returns: a list of pairs (output name, float32 array)
+        """
+        # contiguous copies of the gmfs, shared by all perils
+        imt_gmf = [(im, numpy.ascontiguousarray(gmf)) for im, gmf in imt_gmf]
+        pairs = []
+        for sp in perils:
+            for out, arr in zip(sp.outputs, sp.compute(mag, imt_gmf, sites)):
+                # the outputs are stored as float32 in gmf_data anyway
+                pairs.append((out, numpy.asarray(arr, F32)))
+        return pairs
+
+    def _imts(self, imt_gmf):
+        """
+        :param imt_gmf: a list of pairs (imt, gmf)
+        :returns: a dictionary imt string -> gmf
+        """
+        return {im.string: gmf for im, gmf in imt_gmf}
+
+    def _coeffs(self):
+        """
+        :returns: a dictionary with the parameters passed to __init__
+        """
+        return {par: getattr(self, par) for par in self._init_params}
+
+    def _require(self, imt_gmf, *names):
+        """
+        :param imt_gmf: a list of pairs (imt, gmf)
+        :param names: the required IMT strings
+        :returns: a tuple with the gmfs of the required IMTs
+        """
+        gmfs = self._imts(imt_gmf)
+        missing = [name for name in names if name not in gmfs]
+        if missing:
+            raise ValueError('%s required by the %s model, missing %s' % (
+                ' and '.join(names), self.__class__.__name__,
+                ', '.join(missing)))
+        return tuple(gmfs[name] for name in names)
+
     @abc.abstractmethod
     def prepare(self, sites):
         """Add attributes to sites"""
@@ -98,6 +164,7 @@ class SecondaryPeril(metaclass=abc.ABCMeta):
 
 
 class NewmarkDisplacement(SecondaryPeril):
+    __slots__ = ('c1', 'c2', 'c3', 'c4', 'crit_accel_threshold')
     outputs = ["Disp", "DispProb"]
 
     def __init__(self, c1=-2.71, c2=2.335, c3=-1.478, c4=0.424,
@@ -119,19 +186,18 @@ class NewmarkDisplacement(SecondaryPeril):
                       newmark_critical_accel(sites.Fs, sites.slope))
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGA':
-                nd = newmark_displ_from_pga_M(
-                    gmf, sites.crit_accel, mag,
-                    self.c1, self.c2, self.c3, self.c4,
-                    self.crit_accel_threshold)
-            out.append(nd)
-            out.append(prob_failure_given_displacement(nd))
-        return out
+        pga = self._imts(imt_gmf).get('PGA')
+        if pga is None:
+            return []
+        nd, prob = newmark_displ_prob(
+            pga, sites.crit_accel, mag,
+            self.c1, self.c2, self.c3, self.c4,
+            self.crit_accel_threshold)
+        return [nd, prob]
     
 
 class GrantEtAl2016RockSlopeFailure(SecondaryPeril):
+    __slots__ = ('c1', 'c2', 'c3', 'crit_accel_threshold')
     outputs = ["Disp"]
 
     def __init__(self, c1=0.215, c2=2.341, c3=-1.438,
@@ -146,73 +212,84 @@ class GrantEtAl2016RockSlopeFailure(SecondaryPeril):
             slope=sites.slope,
             cohesion=sites.cohesion_mid,
             friction_angle=sites.friction_mid,
-            saturation_coeff=sites.saturation,
-            soil_dry_density=sites.dry_density))
-        sites.add_col('crit_accel', float,
-                      critical_accel_rock_slope(sites.Fs, sites.slope))
+            relief=sites.relief))
+        sites.add_col('crit_accel', float, critical_accel_rock_slope(
+            sites.Fs, sites.slope, sites.friction_mid))
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGA':
-                nd = newmark_displ_from_pga(
-                    gmf, sites.crit_accel, mag,
-                    self.c1, self.c2, self.c3,
-                    self.crit_accel_threshold)
-            out.append(nd)
-        return out
+        pga = self._imts(imt_gmf).get('PGA')
+        if pga is None:
+            return []
+        nd = newmark_displ(
+            pga, sites.crit_accel,
+            self.c1, self.c2, self.c3,
+            self.crit_accel_threshold)
+        return [nd]
 
 
 class HazusLiquefaction(SecondaryPeril):
+    __slots__ = ('map_proportion_flag',)
     outputs = ["LiqProb"]
 
     def __init__(self, map_proportion_flag=True):
         self.map_proportion_flag = map_proportion_flag
 
     def prepare(self, sites):
-        pass
+        _add_liq_susc_idx(sites)
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGA':
-                out.append(hazus_liquefaction_probability(
-                    pga=gmf, mag=mag, liq_susc_cat=sites.liq_susc_cat,
-                    groundwater_depth=sites.gwd,
-                    do_map_proportion_correction=self.map_proportion_flag))
-        return out
+        pga = self._imts(imt_gmf).get('PGA')
+        if pga is None:
+            return []
+        idx = sites.liq_susc_idx
+        coeffs = _COND_PROB_COEFFS[idx]
+        liq_susc_prob = numpy.clip(coeffs[:, 0] * pga - coeffs[:, 1], 0., 1.)
+        if self.map_proportion_flag:
+            map_unit_proportion = _MAP_PROPORTION[idx]
+        else:
+            map_unit_proportion = 1.0
+        return [hazus_liquefaction_probability_fn(
+            liq_susc_prob, mag, map_unit_proportion, sites.gwd)]
 
 
 class HazusDeformation(SecondaryPeril):
     """
     Computes PGDMax or PGDGeomMean from PGA
     """
+    __slots__ = ('return_unit', 'deformation_component',
+                 'pga_threshold_table', 'pga_threshold_arr', 'settlement_arr')
+
     def __init__(self, return_unit='m', deformation_component='PGDMax',
         pga_threshold_table=HAZUS_LIQUEFACTION_PGA_THRESHOLD_TABLE):
         self.return_unit = return_unit
         self.deformation_component = getattr(imt, deformation_component)
-        self.outputs = [deformation_component]
 
         if pga_threshold_table != HAZUS_LIQUEFACTION_PGA_THRESHOLD_TABLE:
             pga_threshold_table = {k.encode('utf-8'): v
                 for k, v in pga_threshold_table.items()}
         self.pga_threshold_table=pga_threshold_table
+        self.pga_threshold_arr = numpy.array(
+            [pga_threshold_table[cat] for cat in _CAT_TO_IDX])
+        self.settlement_arr = hazus_vertical_settlement(
+            list(_CAT_TO_IDX), return_unit=return_unit)
+
+    @property
+    def outputs(self):
+        # the output depends on the deformation_component parameter
+        return [self.deformation_component.__name__]
 
     def prepare(self, sites):
-        pass
+        _add_liq_susc_idx(sites)
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGA':
-                ls = hazus_lateral_spreading_displacement(
-                    mag=mag, pga=gmf, liq_susc_cat=sites.liq_susc_cat,
-                    pga_threshold_table=self.pga_threshold_table,
-                    return_unit=self.return_unit)
-                vs = hazus_vertical_settlement(
-                    sites.liq_susc_cat, return_unit=self.return_unit)
-                out.append(self.deformation_component(ls, vs))
-        return out
+        pga = self._imts(imt_gmf).get('PGA')
+        if pga is None:
+            return []
+        idx = sites.liq_susc_idx
+        ls = _convert_from_inches(hazus_lateral_spreading_displacement_fn(
+            mag, pga, self.pga_threshold_arr[idx]), self.return_unit)
+        vs = self.settlement_arr[idx]
+        return [self.deformation_component(ls, vs)]
 
 
 class ZhuEtAl2015LiquefactionGeneral(SecondaryPeril):
@@ -220,6 +297,7 @@ class ZhuEtAl2015LiquefactionGeneral(SecondaryPeril):
     Computes the liquefaction probability from PGA and transforms it
     to binary output via the predefined probability threshold.
     """
+    __slots__ = ('intercept', 'pgam_coeff', 'cti_coeff', 'vs30_coeff')
     outputs = ["LiqProb","LiqOccur"]
 
     def __init__(self, intercept=24.1, pgam_coeff=2.067, cti_coeff=0.355,
@@ -233,14 +311,13 @@ class ZhuEtAl2015LiquefactionGeneral(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGA':
-                prob_liq, out_class = zhu_etal_2015_general(
-                    pga=gmf, mag=mag, cti=sites.cti, vs30=sites.vs30)
-            out.append(prob_liq)
-            out.append(out_class)
-        return out
+        pga = self._imts(imt_gmf).get('PGA')
+        if pga is None:
+            return []
+        prob_liq, out_class = zhu_etal_2015_general(
+            pga=pga, mag=mag, cti=sites.cti, vs30=sites.vs30,
+            **self._coeffs())
+        return [prob_liq, out_class]
     
 
 class ZhuEtAl2017LiquefactionCoastal(SecondaryPeril):
@@ -248,6 +325,8 @@ class ZhuEtAl2017LiquefactionCoastal(SecondaryPeril):
     Computes the liquefaction probability from PGV and transforms it
     to binary output via the predefined probability threshold.
     """
+    __slots__ = ('intercept', 'pgv_coeff', 'vs30_coeff', 'dr_coeff',
+                 'dc_coeff', 'dcdr_coeff', 'precip_coeff')
     outputs = ["LiqProb","LiqOccur","LSE"]
 
     def __init__(self, intercept=12.435, pgv_coeff=0.301, vs30_coeff=-2.615,
@@ -265,16 +344,14 @@ class ZhuEtAl2017LiquefactionCoastal(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                prob_liq, out_class, lse = zhu_etal_2017_coastal(
-                    pgv=gmf, vs30=sites.vs30, dr=sites.dr, 
-                    dc=sites.dc, precip=sites.precip)
-            out.append(prob_liq)
-            out.append(out_class)
-            out.append(lse)
-        return out
+        pgv = self._imts(imt_gmf).get('PGV')
+        if pgv is None:
+            return []
+        prob_liq, out_class, lse = zhu_etal_2017_coastal(
+            pgv=pgv, vs30=sites.vs30, dr=sites.dr,
+            dc=sites.dc, precip=sites.precip,
+            **self._coeffs())
+        return [prob_liq, out_class, lse]
 
 
 class ZhuEtAl2017LiquefactionGeneral(SecondaryPeril):
@@ -282,6 +359,8 @@ class ZhuEtAl2017LiquefactionGeneral(SecondaryPeril):
     Computes the liquefaction probability from PGV and transforms it
     to binary output via the predefined probability threshold.
     """
+    __slots__ = ('intercept', 'pgv_scaling_factor', 'pgv_coeff', 'vs30_coeff',
+                 'dw_coeff', 'wtd_coeff', 'precip_coeff')
     outputs = ["LiqProb","LiqOccur","LSE"]
 
     def __init__(self, intercept=8.801, pgv_scaling_factor=1.0, pgv_coeff=0.334, vs30_coeff=-1.918, 
@@ -298,16 +377,14 @@ class ZhuEtAl2017LiquefactionGeneral(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                prob_liq, out_class, lse = zhu_etal_2017_general(
-                    pgv=gmf, vs30=sites.vs30, dw=sites.dw, 
-                    wtd=sites.gwd, precip=sites.precip)
-            out.append(prob_liq)
-            out.append(out_class)
-            out.append(lse)
-        return out
+        pgv = self._imts(imt_gmf).get('PGV')
+        if pgv is None:
+            return []
+        prob_liq, out_class, lse = zhu_etal_2017_general(
+            pgv=pgv, vs30=sites.vs30, dw=sites.dw,
+            wtd=sites.gwd, precip=sites.precip,
+            **self._coeffs())
+        return [prob_liq, out_class, lse]
 
 
 class RashidianBaise2020Liquefaction(SecondaryPeril):
@@ -315,6 +392,8 @@ class RashidianBaise2020Liquefaction(SecondaryPeril):
     Computes the liquefaction probability from PGV and PGA and transforms it
     to binary output via the predefined probability threshold.
     """
+    __slots__ = ('intercept', 'pgv_scaling_factor', 'pgv_coeff', 'vs30_coeff',
+                 'dw_coeff', 'wtd_coeff', 'precip_coeff')
     outputs = ["LiqProb","LiqOccur","LSE"]
 
     def __init__(self, intercept=8.801, pgv_scaling_factor=1.0, pgv_coeff=0.334, vs30_coeff=-1.918, 
@@ -332,21 +411,11 @@ class RashidianBaise2020Liquefaction(SecondaryPeril):
 
     def compute(self, mag, imt_gmf, sites):
         out = []
-        pga = None
-        pgv = None
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                pgv = gmf
-            elif im.string == 'PGA':
-                pga = gmf
-            else:
-                continue
-        # Raise error if either PGA or PGV is missing
-        if pga is None or pgv is None:
-            raise ValueError("Both PGA and PGV are required to compute liquefaction probability using the RashidianBaise2020Liquefaction model")
+        pga, pgv = self._require(imt_gmf, 'PGA', 'PGV')
         prob_liq, out_class, lse = rashidian_baise_2020(
             pga=pga, pgv=pgv, vs30=sites.vs30, dw=sites.dw, 
-            wtd=sites.gwd, precip=sites.precip)
+            wtd=sites.gwd, precip=sites.precip,
+            **self._coeffs())
         out.append(prob_liq)
         out.append(out_class)
         out.append(lse)
@@ -358,6 +427,8 @@ class AllstadtEtAl2022Liquefaction(SecondaryPeril):
     Computes the liquefaction probability from PGV and PGA and transforms it
     to binary output via the predefined probability threshold.
     """
+    __slots__ = ('intercept', 'pgv_coeff', 'vs30_coeff', 'dw_coeff',
+                 'wtd_coeff', 'precip_coeff')
     outputs = ["LiqProb","LiqOccur","LSE"]
 
     def __init__(self, intercept=8.801, pgv_coeff=0.334, vs30_coeff=-1.918, 
@@ -374,24 +445,11 @@ class AllstadtEtAl2022Liquefaction(SecondaryPeril):
 
     def compute(self, mag, imt_gmf, sites):
         out = []
-        pga = None
-        pgv = None
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                pgv = gmf
-            elif im.string == 'PGA':
-                pga = gmf
-            else:
-                continue
-        # Raise error if either PGA or PGV is missing
-        if pga is None or pgv is None:
-            raise ValueError(
-                "Both PGA and PGV are required to compute liquefaction "
-                "probability using the AllstadtEtAl2022Liquefaction model")
-        
+        pga, pgv = self._require(imt_gmf, 'PGA', 'PGV')
         prob_liq, out_class, lse = allstadt_etal_2022(
             pga=pga, pgv=pgv, mag=mag, vs30=sites.vs30, dw=sites.dw, 
-            wtd=sites.gwd, precip=sites.precip)
+            wtd=sites.gwd, precip=sites.precip,
+            **self._coeffs())
         out.append(prob_liq)
         out.append(out_class)
         out.append(lse)
@@ -404,6 +462,8 @@ class AkhlagiEtAl2021LiquefactionA(SecondaryPeril):
     to binary output via the predefined probability threshold.
     """
     experimental = True
+    __slots__ = ('intercept', 'pgv_coeff', 'tri_coeff', 'dc_coeff',
+                 'dr_coeff', 'zwb_coeff')
     outputs = ["LiqProb","LiqOccur"]
 
     def __init__(self, intercept=4.925, pgv_coeff=0.694, tri_coeff=-0.459, 
@@ -419,15 +479,14 @@ class AkhlagiEtAl2021LiquefactionA(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                prob_liq, out_class = akhlagi_etal_2021_model_a(
-                    pgv=gmf, tri=sites.tri, dc=sites.dc, 
-                    dr=sites.dr, zwb=sites.zwb)
-            out.append(prob_liq)
-            out.append(out_class)
-        return out
+        pgv = self._imts(imt_gmf).get('PGV')
+        if pgv is None:
+            return []
+        prob_liq, out_class = akhlagi_etal_2021_model_a(
+            pgv=pgv, tri=sites.tri, dc=sites.dc,
+            dr=sites.dr, zwb=sites.zwb,
+            **self._coeffs())
+        return [prob_liq, out_class]
     
 
 class AkhlagiEtAl2021LiquefactionB(SecondaryPeril):
@@ -436,6 +495,8 @@ class AkhlagiEtAl2021LiquefactionB(SecondaryPeril):
     to binary output via the predefined probability threshold.
     """
     experimental = True
+    __slots__ = ('intercept', 'pgv_coeff', 'vs30_coeff', 'dc_coeff',
+                 'dr_coeff', 'zwb_coeff')
     outputs = ["LiqProb","LiqOccur"]
 
     def __init__(self, intercept=9.504, pgv_coeff=0.706, vs30_coeff=-0.994, 
@@ -451,15 +512,14 @@ class AkhlagiEtAl2021LiquefactionB(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                prob_liq, out_class = akhlagi_etal_2021_model_b(
-                    pgv=gmf, vs30=sites.vs30, dc=sites.dc, 
-                    dr=sites.dr, zwb=sites.zwb)
-            out.append(prob_liq)
-            out.append(out_class)
-        return out
+        pgv = self._imts(imt_gmf).get('PGV')
+        if pgv is None:
+            return []
+        prob_liq, out_class = akhlagi_etal_2021_model_b(
+            pgv=pgv, vs30=sites.vs30, dc=sites.dc,
+            dr=sites.dr, zwb=sites.zwb,
+            **self._coeffs())
+        return [prob_liq, out_class]
 
 
 class Bozzoni2021LiquefactionEurope(SecondaryPeril):
@@ -467,6 +527,7 @@ class Bozzoni2021LiquefactionEurope(SecondaryPeril):
     Computes the liquefaction probability from PGA and transforms it
     to binary output via the predefined probability threshold.
     """
+    __slots__ = ('intercept', 'pgam_coeff', 'cti_coeff', 'vs30_coeff')
     outputs = ["LiqProb","LiqOccur"]
 
     def __init__(self, intercept=-11.489, pgam_coeff=3.864, cti_coeff=2.328,
@@ -480,17 +541,13 @@ class Bozzoni2021LiquefactionEurope(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGA':
-                prob_liq, out_class = bozzoni_etal_2021_europe(
-                    pga=gmf, mag=mag, cti=sites.cti, vs30=sites.vs30)
-            out.append(prob_liq)
-            out.append(out_class)
-        return out
-
-
-supported = [cls.__name__ for cls in SecondaryPeril.__subclasses__()]
+        pga = self._imts(imt_gmf).get('PGA')
+        if pga is None:
+            return []
+        prob_liq, out_class = bozzoni_etal_2021_europe(
+            pga=pga, mag=mag, cti=sites.cti, vs30=sites.vs30,
+            **self._coeffs())
+        return [prob_liq, out_class]
 
 
 class TodorovicSilva2022NonParametric(SecondaryPeril):
@@ -499,6 +556,7 @@ class TodorovicSilva2022NonParametric(SecondaryPeril):
     to probability of belonging to positive class, i.e., liquefaction
     occurrence.
     """
+    __slots__ = ()
     outputs = ["LiqOccur", "LiqProb"]
 
     def __init__(self):
@@ -508,16 +566,21 @@ class TodorovicSilva2022NonParametric(SecondaryPeril):
         pass
 
     def compute(self, mag, imt_gmf, sites):
-        out = []
-        for im, gmf in imt_gmf:
-            if im.string == 'PGV':
-                out_class, out_prob = \
-                    todorovic_silva_2022_nonparametric_general(
-                        pgv=gmf, vs30=sites.vs30, dw=sites.dw,
-                        wtd=sites.gwd, precip=sites.precip)
-            out.append(out_class)
-            out.append(out_prob)
-        return out
+        pgv = self._imts(imt_gmf).get('PGV')
+        if pgv is None:
+            return []
+        out_class, out_prob = \
+            todorovic_silva_2022_nonparametric_general(
+                pgv=pgv, vs30=sites.vs30, dw=sites.dw,
+                wtd=sites.gwd, precip=sites.precip)
+        return [out_class, out_prob]
+
+
+def get_supported():
+    """
+    :returns: the names of the SecondaryPeril subclasses
+    """
+    return tuple(cls.__name__ for cls in SecondaryPeril.__subclasses__())
 
 
-supported = [cls.__name__ for cls in SecondaryPeril.__subclasses__()]
+supported = list(get_supported())
@@ -64,12 +64,13 @@ def static_factor_of_safety(
         slope[slope == 0.0] = 1e-5
 
     r_slope = np.radians(slope)
-    r_fric_ang = np.radians(friction_angle)
+    tan_slope = np.tan(r_slope)
+    tan_fric_ang = np.tan(np.radians(friction_angle))
 
     term_1 = cohesion / (soil_weight * slab_thickness * np.sin(r_slope))
-    term_2 = np.tan(r_fric_ang) / np.tan(r_slope)
-    term_3 = (saturation_coeff * water_weight * np.tan(r_fric_ang)) / (
-        soil_weight * np.tan(r_slope))
+    term_2 = tan_fric_ang / tan_slope
+    term_3 = (saturation_coeff * water_weight * tan_fric_ang) / (
+        soil_weight * tan_slope)
 
     return term_1 + term_2 - term_3
 
@@ -2,7 +2,10 @@ from typing import Union
 
 import numpy as np
 
+from openquake.baselib.performance import jittable
+
 g: float = 9.81
+LN10 = np.log(10.)
 
 def newmark_critical_accel(
     factor_of_safety: Union[float, np.ndarray], slope: Union[float, np.ndarray]
@@ -25,7 +28,7 @@ def newmark_critical_accel(
     if np.isscalar(crit_accel):
         return max([0., crit_accel])
     else:
-        return np.array([max([0., ca]) for ca in crit_accel])
+        return np.maximum(crit_accel, 0.)
 
 
 def newmark_displ_from_pga_M(
@@ -147,3 +150,38 @@ def prob_failure_given_displacement(
 
     return c1 * (1 - np.exp(c2 * Dn ** c3))
 
+
+
+@jittable
+def newmark_displ_prob(pga, critical_accel, M, c1, c2, c3, c4,
+                       crit_accel_threshold):
+    """
+    Computes in a single pass over the sites the displacement of
+    :func:`newmark_displ_from_pga_M` and the probability of failure of
+    :func:`prob_failure_given_displacement` (with the default constants).
+    Unlike :func:`newmark_displ_from_pga_M`, the pga array is not modified.
+
+    :returns: a pair of arrays (displacement in meters, probability)
+    """
+    N = len(pga)
+    disp = np.empty(N)
+    prob = np.empty(N)
+    k = (c1 + c4 * M) * LN10
+    for i in range(N):
+        accel_ratio = critical_accel[i] / (pga[i] if pga[i] != 0. else 1e-5)
+        if accel_ratio > 1.0:
+            accel_ratio = 1.0
+        if accel_ratio <= crit_accel_threshold:
+            accel_ratio = crit_accel_threshold
+        # 10 ** (c1 + log10((1 - ratio) ** c2 * ratio ** c3) + c4 * M)
+        # computed in base e; a zero product is replaced by 1e-100
+        if accel_ratio < 1.0:
+            d_cm = np.exp(k + c2 * np.log(1. - accel_ratio) +
+                          c3 * np.log(accel_ratio))
+        else:
+            d_cm = np.exp(k - 100. * LN10)
+        if d_cm < 1e-99:
+            d_cm = 0.0
+        disp[i] = d_cm / 100.0
+        prob[i] = 0.335 * (1 - np.exp(-0.048 * (disp[i] * 100.0) ** 1.565))
+    return disp, prob
@@ -2,7 +2,10 @@ from typing import Union
 
 import numpy as np
 
+from openquake.baselib.performance import jittable
+
 g: float = 9.81
+LN10 = np.log(10.)
 
 def critical_accel_rock_slope(
     factor_of_safety: Union[float, np.ndarray], slope: Union[float, np.ndarray],
@@ -31,7 +34,7 @@ def critical_accel_rock_slope(
     if np.isscalar(crit_accel):
         return max([0., crit_accel])
     else:
-        return np.array([max([0., ca]) for ca in crit_accel])
+        return np.maximum(crit_accel, 0.)
 
 
 def newmark_displ_from_pga(
@@ -120,3 +123,33 @@ def newmark_displ_from_pga(
 
     return d_m
 
+
+
+@jittable
+def newmark_displ(pga, critical_accel, c1, c2, c3, crit_accel_threshold):
+    """
+    Computes the displacement of :func:`newmark_displ_from_pga` in a single
+    pass over the sites, without modifying the pga array.
+
+    :returns: the displacement in meters
+    """
+    N = len(pga)
+    disp = np.empty(N)
+    k = c1 * LN10
+    for i in range(N):
+        accel_ratio = critical_accel[i] / (pga[i] if pga[i] != 0. else 1e-5)
+        if accel_ratio > 1.0:
+            accel_ratio = 1.0
+        if accel_ratio <= crit_accel_threshold:
+            accel_ratio = crit_accel_threshold
+        # 10 ** (c1 + log10((1 - ratio) ** c2 * ratio ** c3)) computed
+        # in base e; a zero product is replaced by 1e-100
+        if accel_ratio < 1.0:
+            d_cm = np.exp(k + c2 * np.log(1. - accel_ratio) +
+                          c3 * np.log(accel_ratio))
+        else:
+            d_cm = np.exp(k - 100. * LN10)
+        if d_cm < 1e-99:
+            d_cm = 0.0
+        disp[i] = d_cm / 100.0
+    return disp
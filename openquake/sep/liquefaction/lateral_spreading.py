@@ -72,6 +72,13 @@ def hazus_lateral_spreading_displacement(
             [pga_threshold_table[susc_cat] for susc_cat in liq_susc_cat]
         )
     disp_inch = hazus_lateral_spreading_displacement_fn(mag, pga, pga_threshold)
+    return _convert_from_inches(disp_inch, return_unit)
+
+
+def _convert_from_inches(disp_inch, return_unit):
+    """
+    Converts displacements in inches to the given unit ('m', 'cm' or 'in')
+    """
     if return_unit == "m":
         disp_m = disp_inch / (INCH_PER_M)
         return disp_m
@@ -20,6 +20,7 @@ from typing import Union
 import numpy as np
 import gzip
 import os
+from openquake.baselib.performance import jittable
 try:
     import onnxruntime
 except ImportError:
@@ -84,7 +85,45 @@ NUM = 10 ** 2.24
 
 
 def sigmoid(x):
-    return 1.0 / (1.0 + np.exp(-x))
+    if np.isscalar(x):
+        return 1.0 / (1.0 + np.exp(-x))
+    # compute 1 / (1 + exp(-x)) in place, with a single allocation
+    x = np.asarray(x)
+    out = np.negative(x, dtype=np.result_type(x, 1.))  # float for int x
+    np.exp(out, out=out)
+    out += 1.0
+    return np.reciprocal(out, out=out)
+
+
+@jittable
+def _logistic(xg, zero, threshold):
+    # probability of liquefaction and binary class computed in a single
+    # pass over the sites; the probability is set to 0 where zero is True
+    N = len(xg)
+    prob = np.empty(N)
+    cls = np.empty(N, np.uint8)
+    for i in range(N):
+        p = 0. if zero[i] else 1. / (1. + np.exp(-xg[i]))
+        prob[i] = p
+        cls[i] = p > threshold
+    return prob, cls
+
+
+def _prob_class(Xg, threshold, zero=False):
+    """
+    :param Xg: linear predictor of the logistic model (scalar or array)
+    :param threshold: probability threshold of the liquefaction class
+    :param zero: boolean mask of the sites with zero probability
+    :returns: the probability of liquefaction and the binary class
+    """
+    if np.isscalar(Xg):
+        prob_liq = 0. if zero else sigmoid(Xg)
+        return prob_liq, np.uint8(prob_liq > threshold)
+    Xg = np.asarray(Xg)
+    zero = np.broadcast_to(np.asarray(zero), Xg.shape)
+    # the kernel works on 1-D arrays, so N-D inputs are flattened
+    prob, cls = _logistic(Xg.ravel(), zero.ravel(), threshold)
+    return prob.reshape(Xg.shape), cls.reshape(Xg.shape)
 
 
 def _idriss_magnitude_scaling_factor(mag: float):
@@ -120,8 +159,15 @@ def _liquefaction_spatial_extent(a: float, b: float, c: float, p: float):
     Bulletin of the Seismological Society of America, 107(3), 1365–1385.
     https://doi.org/10.1785/0120160198
     """
-    LSE = a / (1 + b * np.exp(-c * p)) **2
-    return LSE
+    if np.isscalar(p):
+        return a / (1 + b * np.exp(-c * p)) **2
+    # compute a / (1 + b * exp(-c * p)) ** 2 in place
+    LSE = np.multiply(p, -c)
+    np.exp(LSE, out=LSE)
+    LSE *= b
+    LSE += 1
+    np.square(LSE, out=LSE)
+    return np.divide(a, LSE, out=LSE)
 
 
 def zhu_etal_2015_general(
@@ -163,8 +209,7 @@ def zhu_etal_2015_general(
     pga_scale = pga * _idriss_magnitude_weighting_factor(mag)
     Xg = (pgam_coeff * np.log(pga_scale) + cti_coeff * cti
           + vs30_coeff * np.log(vs30) + intercept)
-    prob_liq = sigmoid(Xg)
-    out_class = np.where(prob_liq > 0.2, 1, 0)
+    prob_liq, out_class = _prob_class(Xg, 0.2)
     return prob_liq, out_class
 
 
@@ -221,13 +266,12 @@ def zhu_etal_2017_coastal(
     Xg = (pgv_coeff * np.log(pgv) + vs30_coeff * np.log(vs30) 
           + precip_coeff * precip + dc_coeff * np.sqrt(dc) 
           + dr_coeff * dr + dcdr_coeff * np.sqrt(dc) * dr + intercept)
-    prob_liq = sigmoid(Xg)
 
     # Zhu et al. 2017 heuristically assign zero to the predicted probability 
     # for both models when PGV < 3 cm/s. Similarly, they assign zero to the
     # probability when VS30 > 620 m/s.
-    prob_liq = np.where((pgv < 3.0) | (vs30 > 620), 0, prob_liq)
-    out_class = np.where(prob_liq > 0.4, 1, 0)
+    prob_liq, out_class = _prob_class(
+        Xg, 0.4, (pgv < 3.0) | (vs30 > 620))
     LSE = _liquefaction_spatial_extent(42.08, 62.59, 11.43, prob_liq)
     return prob_liq, out_class, LSE
 
@@ -285,13 +329,12 @@ def zhu_etal_2017_general(
     Xg = (pgv_coeff * np.log(pgv_scaling_factor * pgv) 
           + vs30_coeff * np.log(vs30) + precip_coeff * precip 
           + dw_coeff * dw + wtd_coeff * wtd + intercept)
-    prob_liq = sigmoid(Xg)
 
     # Zhu et al. 2017 heuristically assign zero to the predicted probability
     # for both models when PGV < 3 cm/s. Similarly, they assign zero to the
     # probability when VS30 > 620 m/s.
-    prob_liq = np.where((pgv < 3.0) | (vs30 > 620), 0, prob_liq)
-    out_class = np.where(prob_liq > 0.4, 1, 0)
+    prob_liq, out_class = _prob_class(
+        Xg, 0.4, (pgv < 3.0) | (vs30 > 620))
     LSE = _liquefaction_spatial_extent(49.15, 42.40, 9.165, prob_liq)
     return prob_liq, out_class, LSE
 
@@ -362,7 +405,7 @@ def rashidian_baise_2020(
     # assign zero to the probability when PGA < 0.1 g.
     prob_liq = np.where((pgv < 3.0) | (vs30 > 620), 0, prob_liq)
     prob_liq = np.where(pga < 0.1, 0, prob_liq)
-    out_class = np.where(prob_liq > 0.4, 1, 0)
+    out_class = (prob_liq > 0.4).astype(np.uint8)
     LSE = _liquefaction_spatial_extent(49.15, 42.40, 9.165, prob_liq)
     return prob_liq, out_class, LSE
 
@@ -434,7 +477,7 @@ def allstadt_etal_2022(
       precip_coeff=precip_coeff)
     prob_liq = np.where((pgv < 3.0) | (vs30 > 620), 0, prob_liq)
     prob_liq = np.where(pga < 0.1, 0, prob_liq)
-    out_class = np.where(prob_liq > 0.4, 1, 0)
+    out_class = (prob_liq > 0.4).astype(np.uint8)
     LSE = _liquefaction_spatial_extent(49.15, 42.40, 9.165, prob_liq)
     return prob_liq, out_class, LSE
 
@@ -488,8 +531,7 @@ def akhlagi_etal_2021_model_a(
     Xg = (pgv_coeff * np.log(pgv) + tri_coeff * np.sqrt(tri)
           + dc_coeff * np.log(dc + 1) + dr_coeff * np.log(dr + 1)
           + zwb_coeff * np.sqrt(zwb) + intercept)
-    prob_liq = sigmoid(Xg)
-    out_class = np.where(prob_liq > 0.4, 1, 0)
+    prob_liq, out_class = _prob_class(Xg, 0.4)
     return prob_liq, out_class
 
 
@@ -543,8 +585,7 @@ def akhlagi_etal_2021_model_b(
     Xg = (pgv_coeff * np.log(pgv)  + vs30_coeff * np.log(vs30)
           + dc_coeff * np.log(dc + 1) + dr_coeff * np.log(dr + 1)
           + zwb_coeff * np.sqrt(zwb) + intercept)
-    prob_liq = sigmoid(Xg)
-    out_class = np.where(prob_liq > 0.4, 1, 0)
+    prob_liq, out_class = _prob_class(Xg, 0.4)
     return prob_liq, out_class
 
 
@@ -595,8 +636,7 @@ def bozzoni_etal_2021_europe(
         + vs30_coeff * np.log(vs30)
         + intercept
     )
-    prob_liq = sigmoid(Xg)
-    out_class = np.where(prob_liq > 0.57, 1, 0)
+    prob_liq, out_class = _prob_class(Xg, 0.57)
     return prob_liq, out_class
 
 
@@ -752,10 +792,6 @@ def hazus_liquefaction_probability(
         analysis, or how to compare this to other liquefaction models.
         Defaults to `True` following the HAZUS methods.
     """
-    groundwater_corr = _hazus_groundwater_correction_factor(
-      groundwater_depth, unit="m")
-    mag_corr = _hazus_magnitude_correction_factor(mag)
-
     if isinstance(liq_susc_cat, str):
         liq_susc_prob = _hazus_conditional_liquefaction_probability(
           pga, liq_susc_cat)
@@ -776,4 +812,31 @@ def hazus_liquefaction_probability(
         else:
             map_unit_proportion = 1.0
 
+    return hazus_liquefaction_probability_fn(
+        liq_susc_prob, mag, map_unit_proportion, groundwater_depth)
+
+
+def hazus_liquefaction_probability_fn(
+    liq_susc_prob: Union[float, np.ndarray],
+    mag: Union[float, np.ndarray],
+    map_unit_proportion: Union[float, np.ndarray] = 1.0,
+    groundwater_depth: float = 1.524,
+) -> Union[float, np.ndarray]:
+    """
+    Functional form of the HAZUS liquefaction probability, with the
+    susceptibility category already resolved into the conditional
+    probability and the map unit proportion.
+
+    :param liq_susc_prob:
+        Probability of liquefaction conditional on the PGA
+    :param mag:
+        Magnitude of causative earthquake (moment or work scale)
+    :param map_unit_proportion:
+        Proportion of the map unit susceptible to liquefaction
+    :param groundwater_depth:
+        Depth to the groundwater from the earth surface in meters
+    """
+    groundwater_corr = _hazus_groundwater_correction_factor(
+      groundwater_depth, unit="m")
+    mag_corr = _hazus_magnitude_correction_factor(mag)
     return liq_susc_prob * map_unit_proportion / (groundwater_corr * mag_corr)
@@ -14,6 +14,22 @@ class test_zhu_functions(unittest.TestCase):
             liquefaction._idriss_magnitude_weighting_factor(mags), test_res
         )
 
+    def test_sigmoid_int(self):
+        np.testing.assert_array_almost_equal(
+            liquefaction.sigmoid(np.array([0, 1, 2])),
+            [0.5, 0.73105858, 0.88079708])
+
+    def test_zhu_2017_general_2d(self):
+        # 2-D inputs give the same results as the flattened ones
+        pgv = np.array([[10.0, 30.0], [50.0, 70.0]])
+        prob, cls, lse = liquefaction.zhu_etal_2017_general(
+            pgv, 300.0, 10.0, 2.0, 100.0)
+        prob1, cls1, lse1 = liquefaction.zhu_etal_2017_general(
+            pgv.ravel(), 300.0, 10.0, 2.0, 100.0)
+        self.assertEqual(prob.shape, (2, 2))
+        np.testing.assert_array_almost_equal(prob.ravel(), prob1)
+        np.testing.assert_array_equal(cls.ravel(), cls1)
+
 
 class test_hazus_liquefaction_functions(unittest.TestCase):
     def test_hazus_magnitude_correction_factor(self):